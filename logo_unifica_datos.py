@@ -1,11 +1,33 @@
 import os
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
 import warnings
-from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 
 warnings.filterwarnings("ignore", category=UserWarning, module='openpyxl')
 
+# Motores Excel: xlsxwriter (escritura) y calamine (lectura) si están instalados; si no, openpyxl
+try:
+    import xlsxwriter  # noqa: F401
+    MOTOR_ESCRITURA = 'xlsxwriter'
+except ImportError:
+    MOTOR_ESCRITURA = 'openpyxl'
+try:
+    import python_calamine  # noqa: F401
+    MOTOR_LECTURA = 'calamine'
+except ImportError:
+    MOTOR_LECTURA = 'openpyxl'
+# Strings respaldados por Arrow (strip/eq en C) si pyarrow está instalado
+try:
+    import pyarrow  # noqa: F401
+    DTYPE_TEXTO = 'string[pyarrow]'
+except ImportError:
+    DTYPE_TEXTO = 'string'
+
 # Carpetas
 carpeta_entrada = 'excel_longo'
 carpeta_salida = 'excel_procesado'
@@ -81,6 +103,9 @@ mapeo_grupos = {
     'Sustituciones': 'SUSTITUCIONES',
 }
 
+# Precalculado por sección: (grupo, lado) con lado 'L' (OUR → local), 'V' (OPP → visitante) o ''
+MAPEO = {k: (v, 'L' if 'OUR' in k else 'V' if 'OPP' in k else '') for k, v in mapeo_grupos.items()}
+
 # Validar nombre de hoja
 def nombre_valido(nombre):
     return nombre.replace('/', '_').replace('\\', '_').replace('?', '_').replace('*', '_').replace('[', '_').replace(']', '_').replace(':', '_')[:31]
@@ -99,52 +124,52 @@ def normalizar_columnas(cols):
 # Extraer metadatos
 def extraer_metadatos(ruta_archivo):
     try:
-        wb = load_workbook(ruta_archivo, data_only=True)
+        wb = load_workbook(ruta_archivo, data_only=True, read_only=True, keep_links=False)
         ws = wb.active
+        # Una sola pasada sobre B3:B10 (sin materializar celdas sueltas)
+        rows = list(ws.iter_rows(min_row=3, max_row=10, min_col=2, max_col=2, values_only=True))
+        wb.close()
+        valores = [r[0] if r else None for r in rows] + [None] * (8 - len(rows))
         return {
-            'fecha_partido': ws['B3'].value or '',
-            'torneo': f"{ws['B4'].value or ''} {ws['B5'].value or ''}".strip(),
-            'equipo_local': ws['B6'].value or '',
-            'equipo_visitante': ws['B7'].value or '',
-            'arbitro': ws['B8'].value or '',
-            'ficha': ws['B9'].value or '',
-            'resultado': ws['B10'].value or '',
+            'fecha_partido': valores[0] or '',
+            'torneo': f"{valores[1] or ''} {valores[2] or ''}".strip(),
+            'equipo_local': valores[3] or '',
+            'equipo_visitante': valores[4] or '',
+            'arbitro': valores[5] or '',
+            'ficha': valores[6] or '',
+            'resultado': valores[7] or '',
         }
     except Exception as e:
         print(f"⚠️ Error al leer metadatos: {e}")
         return {}
 
-# Convertir a timedelta
-def tiempo_a_timedelta(valor):
-    if pd.isna(valor) or valor == '' or valor is None:
-        return timedelta()
-    try:
-        if isinstance(valor, str):
-            partes = list(map(int, valor.split(':')))
-            if len(partes) == 2:
-                m, s = partes
-                return timedelta(minutes=m, seconds=s)
-            elif len(partes) == 3:
-                h, m, s = partes
-                return timedelta(hours=h, minutes=m, seconds=s)
-            else:
-                return timedelta()
-        elif isinstance(valor, timedelta):
-            return valor
-        else:
-            # Para objetos time o similares
-            return timedelta(
-                hours=getattr(valor, 'hour', 0),
-                minutes=getattr(valor, 'minute', 0),
-                seconds=getattr(valor, 'second', 0)
-            )
-    except:
-        return timedelta()
+# Convertir una columna completa a timedelta (vectorizado)
+def columna_a_timedelta(serie):
+    texto = (
+        serie.astype(str).str.strip()
+        .str.replace(r'^\d{4}-\d{2}-\d{2}\s+', '', regex=True)  # datetime completo: quedarse con la hora
+        .str.replace(r'^(\d+:\d+)$', r'00:\1', regex=True)        # MM:SS -> 00:MM:SS
+    )
+    return pd.to_timedelta(texto, errors='coerce').fillna(pd.Timedelta(0))
+
+# Columnas de metadatos agregadas a cada fila de datos
+COLUMNAS_META = ('Equipo', 'Torneo', 'Ficha', 'Resultado', 'Arbitro')
+
+# Registrar una sección como (encabezados, filas); el DataFrame se arma una sola vez por grupo
+def agregar_seccion(datos, seccion, headers, filas, meta):
+    grupo, lado = MAPEO[seccion]
+    equipo = meta['equipo_local'] if lado == 'L' else meta['equipo_visitante'] if lado == 'V' else ''
+    valores_meta = [equipo, meta['torneo'], meta['ficha'], meta['resultado'], meta['arbitro']]
+    for fila in filas:
+        fila.extend(valores_meta)
+    if grupo not in datos:
+        datos[grupo] = []
+    datos[grupo].append((tuple(headers) + COLUMNAS_META, filas))
 
 # Extraer secciones
 def extraer_secciones_con_metadatos(ruta_archivo):
     try:
-        wb = load_workbook(ruta_archivo, data_only=True)
+        wb = load_workbook(ruta_archivo, data_only=True, read_only=True, keep_links=False)
         ws = wb.active
     except Exception as e:
         print(f"❌ No se pudo abrir el archivo: {e}")
@@ -152,32 +177,22 @@ def extraer_secciones_con_metadatos(ruta_archivo):
 
     meta = extraer_metadatos(ruta_archivo)
     if not meta:
+        wb.close()
         return {}
 
     datos = {}
     current_section = None
     headers = None
+    n_headers = 0
     data_rows = []
 
     for row in ws.iter_rows(values_only=True):
-        row_list = list(row)
-        first_cell = row_list[0] if row_list else None
+        first_cell = row[0] if row else None
 
         # Detectar nueva sección
-        if first_cell in mapeo_grupos:
+        if first_cell in MAPEO:
             if current_section and headers and data_rows:
-                df = pd.DataFrame(data_rows, columns=headers)
-                equipo = meta['equipo_local'] if 'OUR' in current_section else meta['equipo_visitante'] if 'OPP' in current_section else ''
-                df['Equipo'] = equipo
-                df['Torneo'] = meta['torneo']
-                df['Ficha'] = meta['ficha']
-                df['Resultado'] = meta['resultado']
-                df['Arbitro'] = meta['arbitro']
-
-                grupo = mapeo_grupos[current_section]
-                if grupo not in datos:
-                    datos[grupo] = []
-                datos[grupo].append(df)
+                agregar_seccion(datos, current_section, headers, data_rows, meta)
 
             current_section = first_cell
             headers = None
@@ -186,9 +201,9 @@ def extraer_secciones_con_metadatos(ruta_archivo):
 
         # Detectar encabezados
         if current_section and not headers:
-            raw_row = [str(c) if c is not None else '' for c in row_list]
+            raw_row = [str(c) if c is not None else '' for c in row]
             if 'Tiempo' in raw_row or 'Evento' in raw_row or 'tiempo' in [r.lower() for r in raw_row]:
-                headers = normalizar_columnas(row_list)
+                headers = normalizar_columnas(row)
                 seen = []
                 unique_headers = []
                 for h in headers:
@@ -198,65 +213,66 @@ def extraer_secciones_con_metadatos(ruta_archivo):
                         unique_headers.append(h)
                     seen.append(h)
                 headers = unique_headers
+                n_headers = len(headers)
                 continue
 
         # Recolectar filas de datos
         if current_section and headers:
-            clean_row = [cell if cell is not None else '' for cell in row_list]
-            while len(clean_row) < len(headers):
-                clean_row.append('')
-            if any(str(cell).strip() != '' for cell in clean_row):
-                data_rows.append(clean_row)
+            # Filas vacías se descartan sobre la tupla cruda, antes de construir nada
+            if all(cell is None or str(cell).strip() == '' for cell in row):
+                continue
+            clean_row = ['' if cell is None else cell for cell in row[:n_headers]]
+            if len(clean_row) < n_headers:
+                clean_row.extend([''] * (n_headers - len(clean_row)))
+            data_rows.append(clean_row)
+
+    # En modo read_only el archivo queda abierto hasta cerrarlo explícitamente
+    wb.close()
 
     # Guardar última sección
     if current_section and headers and data_rows:
-        df = pd.DataFrame(data_rows, columns=headers)
-        equipo = meta['equipo_local'] if 'OUR' in current_section else meta['equipo_visitante'] if 'OPP' in current_section else ''
-        df['Equipo'] = equipo
-        df['Torneo'] = meta['torneo']
-        df['Ficha'] = meta['ficha']
-        df['Resultado'] = meta['resultado']
-        df['Arbitro'] = meta['arbitro']
-        grupo = mapeo_grupos[current_section]
-        if grupo not in datos:
-            datos[grupo] = []
-        datos[grupo].append(df)
+        agregar_seccion(datos, current_section, headers, data_rows, meta)
 
     # Combinar por grupo
     resultado = {}
-    for grupo, dfs in datos.items():
-        if not dfs:
+    for grupo, secciones in datos.items():
+        if not secciones:
             continue
         try:
-            # Alinear columnas
-            all_cols = sorted(set(col for df in dfs for col in df.columns))
-            aligned_dfs = []
-            for df in dfs:
-                for col in all_cols:
-                    if col not in df.columns:
-                        df[col] = ''
-                aligned_dfs.append(df[all_cols])
-            combined = pd.concat(aligned_dfs, ignore_index=True)
+            # Alinear columnas y construir un único DataFrame por grupo
+            all_cols = sorted(set(col for cols, _ in secciones for col in cols))
+            filas_grupo = []
+            for cols, filas in secciones:
+                if list(cols) == all_cols:
+                    filas_grupo.extend(filas)
+                    continue
+                # Columnas faltantes apuntan a un '' agregado al final de cada fila
+                posiciones = {col: i for i, col in enumerate(cols)}
+                tomar = itemgetter(*[posiciones.get(col, len(cols)) for col in all_cols])
+                for fila in filas:
+                    fila.append('')
+                filas_grupo.extend(map(tomar, filas))
+            combined = pd.DataFrame(filas_grupo, columns=all_cols)
             combined.dropna(how='all', inplace=True)
 
             # Eliminar columnas innecesarias
-            cols_to_drop = [col for col in combined.columns if col.startswith('Col_') or combined[col].astype(str).str.strip().eq('').all()]
+            # Una sola máscara sobre las columnas de texto (las numéricas nunca están vacías)
+            texto = combined.select_dtypes(include=['object', 'string']).astype(DTYPE_TEXTO)
+            vacias = set(texto.columns[texto.apply(lambda c: c.str.strip()).eq('').all(axis=0)])
+            cols_to_drop = [col for col in combined.columns if col.startswith('Col_') or col in vacias]
             combined.drop(columns=cols_to_drop, inplace=True, errors='ignore')
 
             # ✅ Cálculo de resultado_tiempo en POSESION, OUT y SECUENCIA
             if grupo in ['POSESION', 'OUT', 'SECUENCIA']:
                 if 'TIEMPO' in combined.columns and 'FIN' in combined.columns:
-                    def calcular_diferencia(row):
-                        t1 = tiempo_a_timedelta(row['TIEMPO'])
-                        t2 = tiempo_a_timedelta(row['FIN'])
-                        diff = t2 - t1
-                        if diff.total_seconds() < 0:
-                            diff = timedelta()  # Evitar tiempos negativos
-                        total_seg = int(diff.total_seconds())
-                        mins = total_seg // 60
-                        secs = total_seg % 60
-                        return f"{mins:02d}:{secs:02d}"
-                    combined['resultado_tiempo'] = combined.apply(calcular_diferencia, axis=1)
+                    # Segundos enteros como arrays int64 (igual que el parseo h/m/s original)
+                    t1 = columna_a_timedelta(combined['TIEMPO']).dt.total_seconds().to_numpy(dtype='int64')
+                    t2 = columna_a_timedelta(combined['FIN']).dt.total_seconds().to_numpy(dtype='int64')
+                    total_seg = pd.Series(np.maximum(t2 - t1, 0), index=combined.index)  # Evitar tiempos negativos
+                    combined['resultado_tiempo'] = (
+                        (total_seg // 60).astype(str).str.zfill(2) + ':' +
+                        (total_seg % 60).astype(str).str.zfill(2)
+                    )
 
             if not combined.empty:
                 resultado[grupo] = combined
@@ -266,61 +282,127 @@ def extraer_secciones_con_metadatos(ruta_archivo):
 
     return resultado
 
-# === PASO 1: Procesar archivos ===
-print("🚀 Iniciando procesamiento de archivos...")
-for archivo in os.listdir(carpeta_entrada):
-    if archivo.endswith('.xlsx') or archivo.endswith('.xls'):
-        entrada = os.path.join(carpeta_entrada, archivo)
-        salida = os.path.join(carpeta_salida, f'procesado_{archivo}')
-        print(f"  Procesando: {archivo}")
-        try:
-            secciones = extraer_secciones_con_metadatos(entrada)
-            if not secciones:
-                print(f"    ⚠️  Sin datos: {archivo}")
-                continue
-            with pd.ExcelWriter(salida, engine='openpyxl') as writer:
-                for grupo, df in secciones.items():
-                    if not df.empty:
-                        sheet = nombre_valido(grupo)
-                        df.to_excel(writer, sheet_name=sheet, index=False)
-            print(f"  ✅ Guardado: {salida}")
-        except Exception as e:
-            print(f"  ❌ Error procesando {archivo}: {e}")
-
-# === PASO 2: Consolidar en BD_longo.xlsx ===
-print("\n📊 Consolidando en BD_longo.xlsx...")
-archivos_proc = [f for f in os.listdir(carpeta_salida) if f.startswith('procesado_') and f.endswith('.xlsx')]
-
-if not archivos_proc:
-    print("⚠️ No hay archivos procesados.")
-else:
-    datos_bd = {}
-    for arch in archivos_proc:
-        ruta = os.path.join(carpeta_salida, arch)
-        print(f"  Leyendo: {arch}")
-        try:
-            xl = pd.ExcelFile(ruta)
-            for sheet in xl.sheet_names:
-                df = xl.parse(sheet)
-                if df.empty:
-                    continue
-                df['Archivo_Origen'] = arch
-                key = nombre_valido(sheet)
-                if key not in datos_bd:
-                    datos_bd[key] = []
-                datos_bd[key].append(df)
-        except Exception as e:
-            print(f"  ❌ Error leyendo {arch}: {e}")
+# Procesar un archivo (unidad de trabajo independiente, ejecutada en el pool de procesos)
+def procesar_archivo(archivo):
+    entrada = os.path.join(carpeta_entrada, archivo)
+    salida = os.path.join(carpeta_salida, f'procesado_{archivo}')
+    try:
+        secciones = extraer_secciones_con_metadatos(entrada)
+        if not secciones:
+            return salida, False, f"    ⚠️  Sin datos: {archivo}"
+        with pd.ExcelWriter(salida, engine=MOTOR_ESCRITURA) as writer:
+            for grupo, df in secciones.items():
+                if not df.empty:
+                    sheet = nombre_valido(grupo)
+                    df.to_excel(writer, sheet_name=sheet, index=False)
+        return salida, True, f"  ✅ Guardado: {salida}"
+    except Exception as e:
+        return salida, False, f"  ❌ Error procesando {archivo}: {e}"
 
+# Leer todas las hojas de un archivo procesado (worker de PASO 2)
+def leer_procesado(arch):
+    ruta = os.path.join(carpeta_salida, arch)
     try:
-        with pd.ExcelWriter(archivo_bd, engine='openpyxl') as writer:
-            for sheet_name, dfs in datos_bd.items():
-                final_df = pd.concat(dfs, ignore_index=True)
-                final_df.dropna(how='all', inplace=True)
-                if not final_df.empty:
-                    final_df.to_excel(writer, sheet_name=sheet_name, index=False)
-        print(f"✅ Consolidado: '{archivo_bd}'")
+        # Todas las hojas en una sola lectura (dict hoja -> DataFrame)
+        return pd.read_excel(ruta, sheet_name=None, engine=MOTOR_LECTURA), None
     except Exception as e:
-        print(f"❌ Error al guardar '{archivo_bd}': {e}")
+        return {}, e
+
+# Unir los DataFrames de cada hoja (de a una, liberando la entrada a medida que se consume)
+def consolidar_hojas(datos_bd):
+    for sheet_name in list(datos_bd):
+        origen_dfs = datos_bd.pop(sheet_name)
+        # Archivo_Origen sale de las keys del concat, como categoría (no un string por fila)
+        archivos_hoja = [arch for arch, _ in origen_dfs]
+        final_df = pd.concat(
+            [df for _, df in origen_dfs],
+            keys=archivos_hoja,
+            names=['Archivo_Origen', None],
+        ).reset_index(level=0).reset_index(drop=True)
+        origen = final_df.pop('Archivo_Origen')
+        final_df['Archivo_Origen'] = pd.Categorical(origen, categories=list(dict.fromkeys(archivos_hoja)))
+        final_df.dropna(how='all', inplace=True)
+        if not final_df.empty:
+            yield sheet_name, final_df
+
+# Valor de celda con las mismas conversiones que hace pandas al exportar
+def valor_excel(valor):
+    if valor is None or (pd.api.types.is_scalar(valor) and pd.isna(valor)):  # None, NaN, NaT, pd.NA
+        return None
+    if isinstance(valor, (bool, int, float, np.integer, np.floating, np.bool_)):
+        return valor.item() if isinstance(valor, np.generic) else valor
+    if isinstance(valor, Decimal):
+        return float(valor)
+    if isinstance(valor, (datetime, date, time)):  # xlsxwriter los escribe como fecha/hora nativa
+        return valor
+    if isinstance(valor, timedelta):
+        return valor.total_seconds() / 86400
+    return str(valor)
+
+# Escritura en streaming con xlsxwriter constant_memory.
+# pandas.to_excel escribe columna por columna y en ese modo xlsxwriter descarta las celdas
+# de filas ya volcadas, por eso las filas se escriben a mano y en orden.
+def escribir_excel_streaming(ruta, hojas):
+    wb = xlsxwriter.Workbook(ruta, {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd hh:mm:ss'})
+    # Mismos formatos que usa pandas para fechas sin hora y horas sueltas (p.ej. TIEMPO / FIN)
+    formatos = {
+        date: wb.add_format({'num_format': 'yyyy-mm-dd'}),
+        time: wb.add_format({'num_format': 'hh:mm:ss'}),
+    }
+    try:
+        for sheet_name, df in hojas:
+            ws = wb.add_worksheet(sheet_name)
+            ws.write_row(0, 0, [str(col) for col in df.columns])
+            for i, fila in enumerate(df.itertuples(index=False, name=None), start=1):
+                for j, v in enumerate(fila):
+                    v = valor_excel(v)
+                    ws.write(i, j, v, formatos.get(type(v)))
+    finally:
+        wb.close()
+
+# El guard es necesario para ProcessPoolExecutor (en Windows los workers reimportan el módulo)
+if __name__ == '__main__':
+    # === PASO 1: Procesar archivos ===
+    print("🚀 Iniciando procesamiento de archivos...")
+    archivos = [a for a in os.listdir(carpeta_entrada) if a.endswith('.xlsx') or a.endswith('.xls')]
+    print(f"  Procesando {len(archivos)} archivo(s) en paralelo...")
+    # Cada libro es independiente y el parseo es CPU puro: procesos (no threads) para evitar el GIL
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for salida, ok, msg in ex.map(procesar_archivo, archivos):
+            print(msg)
+
+    # === PASO 2: Consolidar en BD_longo.xlsx ===
+    print("\n📊 Consolidando en BD_longo.xlsx...")
+    archivos_proc = [f for f in os.listdir(carpeta_salida) if f.startswith('procesado_') and f.endswith('.xlsx')]
+
+    if not archivos_proc:
+        print("⚠️ No hay archivos procesados.")
+    else:
+        datos_bd = {}
+        print(f"  Leyendo {len(archivos_proc)} archivo(s) en paralelo...")
+        # Lectura en paralelo; la unión por hoja se hace en el proceso principal
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            for arch, (hojas, error) in zip(archivos_proc, ex.map(leer_procesado, archivos_proc)):
+                if error is not None:
+                    print(f"  ❌ Error leyendo {arch}: {error}")
+                    continue
+                for sheet, df in hojas.items():
+                    if df.empty:
+                        continue
+                    key = nombre_valido(sheet)
+                    if key not in datos_bd:
+                        datos_bd[key] = []
+                    datos_bd[key].append((arch, df))
+
+        try:
+            if MOTOR_ESCRITURA == 'xlsxwriter':
+                escribir_excel_streaming(archivo_bd, consolidar_hojas(datos_bd))
+            else:
+                with pd.ExcelWriter(archivo_bd, engine=MOTOR_ESCRITURA) as writer:
+                    for sheet_name, final_df in consolidar_hojas(datos_bd):
+                        final_df.to_excel(writer, sheet_name=sheet_name, index=False)
+            print(f"✅ Consolidado: '{archivo_bd}'")
+        except Exception as e:
+            print(f"❌ Error al guardar '{archivo_bd}': {e}")
 
-print("✅ Proceso completado.")
\ No newline at end of file
+    print("✅ Proceso completado.")
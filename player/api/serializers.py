@@ -2,6 +2,10 @@ from rest_framework import serializers
 from player.models import Match, Play
 
 class PlaySerializer(serializers.ModelSerializer):
+    # MillisecondsField hereda de PositiveIntegerField; se expone en segundos como antes
+    inicio = serializers.DecimalField(max_digits=9, decimal_places=3, read_only=True)
+    fin = serializers.DecimalField(max_digits=9, decimal_places=3, read_only=True)
+
     class Meta:
         model = Play
         fields = [
@@ -19,6 +23,10 @@ class MatchSerializer(serializers.ModelSerializer):
     class Meta:
         model = Match
         fields = ['id', 'home_team', 'away_team', 'match_date', 'video_id', 'match_result']
+        read_only_fields = fields
 
     def get_match_result(self, obj):
-        return obj.plays.exclude(marcador_final='').values_list('marcador_final', flat=True).first() or ''
\ No newline at end of file
+        # `first_marker` viene anotado por MatchViewSet.get_queryset; fallback por si se serializa fuera del viewset
+        if hasattr(obj, 'first_marker'):
+            return obj.first_marker or ''
+        return obj.plays.exclude(marcador_final='').order_by('inicio').values_list('marcador_final', flat=True).first() or ''
\ No newline at end of file
@@ -1,4 +1,5 @@
-from django.db.models import Q, Case, When  # <- asegurar import Q (ya lo usabas) y Case/When si ordenás por ids
+from django.db.models import Q, Case, When, OuterRef, Subquery, Value  # <- asegurar import Q (ya lo usabas) y Case/When si ordenás por ids
+from django.db.models.functions import Coalesce
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
@@ -8,6 +9,23 @@ from django_filters.rest_framework import DjangoFilterBackend
 from player.models import Match, Play
 from .serializers import MatchSerializer, PlaySerializer
 
+# Campos expuestos por la API de jugadas (se leen con .values(), sin instanciar el serializer).
+# `torneo` ya no es columna de Play: se resuelve desde el torneo del partido.
+PLAY_FIELDS = tuple(f for f in PlaySerializer.Meta.fields if f != 'torneo')
+PLAY_COMPUTED_FIELDS = {'torneo': Coalesce('match__tournament__name', Value(''))}
+
+# Campos DecimalField de Play: el serializer los emite como string, mantenemos ese formato
+PLAY_DECIMAL_FIELDS = ('inicio', 'fin')
+
+
+def _decimals_as_str(rows):
+    for row in rows:
+        for field in PLAY_DECIMAL_FIELDS:
+            if row.get(field) is not None:
+                row[field] = str(row[field])
+    return rows
+
+
 class MatchViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Match.objects.all().order_by('-match_date')
     serializer_class = MatchSerializer
@@ -17,6 +35,20 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['home_team', 'away_team']
     ordering_fields = ['match_date', 'id']
 
+    def get_queryset(self):
+        # Marcador resuelto en la misma consulta (evita un SELECT extra por partido en el listado)
+        first_marker = (
+            Play.objects.filter(match=OuterRef('pk'))
+            .exclude(marcador_final='')
+            .order_by('inicio')
+            .values('marcador_final')[:1]
+        )
+        return (
+            Match.objects.only('id', 'home_team', 'away_team', 'match_date', 'video_id')
+            .annotate(first_marker=Subquery(first_marker))
+            .order_by('-match_date')
+        )
+
     @action(detail=True, methods=['get'])
     def plays(self, request, pk=None):
         """
@@ -25,20 +57,17 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
         - Extra: ids=1,2,3 → devuelve exactamente esas jugadas (sin paginación)
         """
         match = self.get_object()
-        qs = match.plays.all().order_by('inicio')
 
-        # NUEVO: permitir traer por ids concretos
+        # NUEVO: permitir traer por ids concretos (se resuelve antes de armar el queryset general)
         ids_csv = request.query_params.get('ids')
         if ids_csv:
-            try:
-                ids = [int(x) for x in ids_csv.split(',') if x.strip().isdigit()]
-            except Exception:
-                ids = []
+            ids = [int(x) for x in ids_csv.split(',') if x.strip().isdigit()]
             if not ids:
                 return Response([])
             qs = match.plays.filter(id__in=ids).order_by('inicio')
-            serializer = PlaySerializer(qs, many=True)
-            return Response(serializer.data)
+            return Response(_decimals_as_str(list(qs.values(*PLAY_FIELDS, **PLAY_COMPUTED_FIELDS))))
+
+        qs = match.plays.all().order_by('inicio')
 
         # Filtros multi-valor
         jugada_values = request.query_params.getlist('jugada')
@@ -55,6 +84,7 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
         if zona_fin_values:
             qs = qs.filter(zona_fin__in=zona_fin_values)
         if q:
+            # Servido por los índices GIN de trigramas (idx_play_*_trgm)
             qs = qs.filter(Q(jugada__icontains=q) | Q(evento__icontains=q) | Q(jugadores__icontains=q))
 
         # Timeline mode: devuelve todas las jugadas con campos mínimos, sin paginar
@@ -62,9 +92,9 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
             data = list(qs.values('id', 'jugada', 'equipo', 'inicio', 'fin'))
             return Response(data)
 
-        page = self.paginate_queryset(qs)
+        # Listado completo: dicts vía .values() (sin instanciar Play ni pasar por el serializer)
+        rows_qs = qs.values(*PLAY_FIELDS, **PLAY_COMPUTED_FIELDS)
+        page = self.paginate_queryset(rows_qs)
         if page is not None:
-            serializer = PlaySerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = PlaySerializer(qs, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+            return self.get_paginated_response(_decimals_as_str(page))
+        return Response(_decimals_as_str(list(rows_qs)))
\ No newline at end of file
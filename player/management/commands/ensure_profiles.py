@@ -0,0 +1,13 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from player.models import Profile
+
+
+class Command(BaseCommand):
+    help = 'Crea en lote los perfiles faltantes (usuarios cargados con bulk_create, fixtures, SQL directo).'
+
+    def handle(self, *args, **options):
+        user_ids = User.objects.filter(profile__isnull=True).values_list('id', flat=True)
+        created = Profile.objects.bulk_ensure(user_ids)
+        self.stdout.write(self.style.SUCCESS(f'Perfiles creados: {created}'))
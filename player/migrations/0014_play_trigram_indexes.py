@@ -0,0 +1,27 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0013_remove_venue_from_match'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='play',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('jugada'), name='gin_trgm_ops'), name='idx_play_jugada_upper_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='play',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('evento'), name='gin_trgm_ops'), name='idx_play_evento_upper_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='play',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('jugadores'), name='gin_trgm_ops'), name='idx_play_jugadores_upper_trgm'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+import json
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+def json_to_array(apps, schema_editor):
+    """Copia los IDs del JSON original al nuevo arreglo int8[]."""
+    SelectionPreset = apps.get_model('player', 'SelectionPreset')
+    for preset in SelectionPreset.objects.only('id', 'play_ids').iterator():
+        raw = preset.play_ids
+        if isinstance(raw, str):
+            try:
+                raw = json.loads(raw or '[]')
+            except ValueError:
+                raw = []
+        ids = []
+        for value in raw or []:
+            try:
+                ids.append(int(value))
+            except (TypeError, ValueError):
+                continue
+        SelectionPreset.objects.filter(pk=preset.pk).update(play_ids_array=ids)
+
+
+def array_to_json(apps, schema_editor):
+    SelectionPreset = apps.get_model('player', 'SelectionPreset')
+    for preset in SelectionPreset.objects.only('id', 'play_ids_array').iterator():
+        SelectionPreset.objects.filter(pk=preset.pk).update(play_ids=list(preset.play_ids_array or []))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0014_play_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='selectionpreset',
+            name='play_ids_array',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, size=None),
+        ),
+        migrations.RunPython(json_to_array, array_to_json),
+        migrations.RemoveField(
+            model_name='selectionpreset',
+            name='play_ids',
+        ),
+        migrations.RenameField(
+            model_name='selectionpreset',
+            old_name='play_ids_array',
+            new_name='play_ids',
+        ),
+        migrations.AddIndex(
+            model_name='selectionpreset',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['play_ids'], name='idx_preset_play_ids'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0015_selectionpreset_play_ids_array'),
+    ]
+
+    operations = [
+        # Duplicaban los índices que ya crea `db_index=True` en cada campo
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_evento',
+        ),
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_equipo',
+        ),
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_zona_inicio',
+        ),
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_zona_fin',
+        ),
+        migrations.AddIndex(
+            model_name='play',
+            index=models.Index(fields=['match', 'equipo', 'inicio'], include=('fin', 'jugada'), name='idx_play_match_equipo_inicio'),
+        ),
+        migrations.AddIndex(
+            model_name='play',
+            index=models.Index(fields=['match', 'evento', 'inicio'], name='idx_play_match_evento_inicio'),
+        ),
+        migrations.AddIndex(
+            model_name='play',
+            index=models.Index(fields=['match', 'zona_inicio', 'zona_fin'], name='idx_play_match_zonas'),
+        ),
+    ]
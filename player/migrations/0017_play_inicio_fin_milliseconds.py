@@ -0,0 +1,43 @@
+from django.db import migrations
+
+import player.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0016_play_composite_indexes'),
+    ]
+
+    operations = [
+        # La conversión de unidades (segundos -> ms) no la puede inferir AlterField:
+        # se hace con SQL explícito y se actualiza sólo el estado del modelo.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=(
+                        'ALTER TABLE "player_play" '
+                        'ALTER COLUMN "inicio" TYPE integer USING round("inicio" * 1000)::integer, '
+                        'ALTER COLUMN "fin" TYPE integer USING round("fin" * 1000)::integer;'
+                    ),
+                    reverse_sql=(
+                        'ALTER TABLE "player_play" '
+                        'ALTER COLUMN "inicio" TYPE numeric(9, 3) USING "inicio" / 1000.0, '
+                        'ALTER COLUMN "fin" TYPE numeric(9, 3) USING "fin" / 1000.0;'
+                    ),
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='play',
+                    name='fin',
+                    field=player.models.MillisecondsField(help_text='Segundo exacto de fin (hasta 3 decimales)', verbose_name='Fin (segundos)'),
+                ),
+                migrations.AlterField(
+                    model_name='play',
+                    name='inicio',
+                    field=player.models.MillisecondsField(help_text='Segundo exacto de inicio (hasta 3 decimales)', verbose_name='Inicio (segundos)'),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,16 @@
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0017_play_inicio_fin_milliseconds'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='play',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['match', 'inicio'], name='idx_play_match_inicio_brin', pages_per_range=32),
+        ),
+    ]
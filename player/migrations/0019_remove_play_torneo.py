@@ -0,0 +1,54 @@
+from collections import Counter
+
+from django.db import migrations
+
+
+def backfill_match_tournament(apps, schema_editor):
+    """Asigna `Match.tournament` a partidos sin torneo a partir del texto `Play.torneo`.
+
+    Se toma el valor más frecuente entre las jugadas del partido y sólo se asigna si
+    coincide exactamente (sin distinguir mayúsculas) con las siglas o el nombre de un torneo.
+    """
+    Match = apps.get_model('player', 'Match')
+    Play = apps.get_model('player', 'Play')
+    Tournament = apps.get_model('player', 'Tournament')
+
+    rows = (
+        Play.objects.filter(match__tournament__isnull=True)
+        .exclude(torneo='')
+        .values_list('match_id', 'torneo')
+    )
+    by_match = {}
+    for match_id, torneo in rows.iterator():
+        by_match.setdefault(match_id, Counter())[torneo.strip()] += 1
+
+    for match_id, counter in by_match.items():
+        name = counter.most_common(1)[0][0]
+        tournament = (
+            Tournament.objects.filter(short_name__iexact=name).first()
+            or Tournament.objects.filter(name__iexact=name).first()
+        )
+        if tournament:
+            Match.objects.filter(pk=match_id).update(tournament=tournament)
+
+
+def restore_play_torneo(apps, schema_editor):
+    Play = apps.get_model('player', 'Play')
+    Tournament = apps.get_model('player', 'Tournament')
+    for tournament in Tournament.objects.all().iterator():
+        Play.objects.filter(match__tournament=tournament).update(torneo=tournament.name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0018_play_match_inicio_brin'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_match_tournament, restore_play_torneo),
+        migrations.RemoveField(
+            model_name='play',
+            name='torneo',
+        ),
+    ]
@@ -0,0 +1,29 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0019_remove_play_torneo'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(django.db.models.functions.text.Upper('home_team'), name='idx_match_home_upper'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(django.db.models.functions.text.Upper('away_team'), name='idx_match_away_upper'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('home_team'), name='gin_trgm_ops'), name='idx_match_home_upper_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('away_team'), name='gin_trgm_ops'), name='idx_match_away_upper_trgm'),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0020_match_team_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(condition=models.Q(video_id__isnull=False), fields=['-match_date', '-created_at'], name='idx_match_analyzed_date'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0021_match_analyzed_date_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_match_inicio',
+        ),
+        migrations.AddIndex(
+            model_name='play',
+            index=models.Index(fields=['match', 'inicio'], include=('id', 'fin', 'evento', 'equipo', 'jugada'), name='idx_play_match_inicio_cov'),
+        ),
+    ]
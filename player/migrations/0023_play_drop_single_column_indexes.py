@@ -0,0 +1,101 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0022_play_match_inicio_covering'),
+    ]
+
+    operations = [
+        # Duplicaban el índice de `db_index=True` del mismo campo
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_inicia',
+        ),
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_situacion',
+        ),
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_tipo',
+        ),
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_accion',
+        ),
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_termina_en',
+        ),
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_sancion',
+        ),
+        migrations.RemoveIndex(
+            model_name='play',
+            name='idx_play_transicion',
+        ),
+        # Categóricos sin filtros fuera de un partido (cubiertos por los compuestos `match, ...`)
+        migrations.AlterField(
+            model_name='play',
+            name='inicia',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Inicia'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='zona_fin',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Zona Fin'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='zona_inicio',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Zona Inicio'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='set',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Set'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='tipo',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Tipo'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='accion',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Accion'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='termina_en',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Termina En'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='sancion',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Sancion'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='situacion',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Situacion'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='transicion',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Transicion'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='situacion_penal',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Situación Penal'),
+        ),
+        migrations.AlterField(
+            model_name='play',
+            name='nueva_categoria',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Nueva Categoría'),
+        ),
+    ]
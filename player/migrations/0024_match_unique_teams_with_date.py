@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0023_play_drop_single_column_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='match',
+            name='match_unique_teams_date',
+        ),
+        migrations.AddConstraint(
+            model_name='match',
+            constraint=models.UniqueConstraint(condition=models.Q(match_date__isnull=False), fields=('home_team', 'away_team', 'match_date'), name='match_unique_teams_with_date'),
+        ),
+    ]
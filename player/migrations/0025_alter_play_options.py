@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0024_match_unique_teams_with_date'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='play',
+            options={'verbose_name': 'Jugada', 'verbose_name_plural': 'Jugadas'},
+        ),
+    ]
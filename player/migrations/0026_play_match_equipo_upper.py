@@ -0,0 +1,16 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('player', '0025_alter_play_options'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='play',
+            index=models.Index(models.F('match'), django.db.models.functions.text.Upper('equipo'), name='idx_play_match_equipo_upper'),
+        ),
+    ]
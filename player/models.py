@@ -16,13 +16,83 @@ Resumen rápido de entidades:
  - SelectionPreset: Permite guardar selecciones de jugadas para reutilización/compartir.
 """
 
-from django.db import models
+from django.db import models, connections, transaction, IntegrityError
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, OpClass
 from django.contrib.auth.models import User 
-from django.db.models.signals import post_save
+from django.db.models.functions import Upper
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.conf import settings
+from django.core.cache import cache
+from django import forms
+from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.utils.functional import cached_property
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+import csv
+import io
 import uuid
 
+class MillisecondsField(models.PositiveIntegerField):
+    """Marca temporal en segundos guardada como entero de milisegundos.
+
+    En Python el valor se expone como `Decimal` en segundos con 3 decimales (el
+    mismo contrato que el antiguo `DecimalField(max_digits=9, decimal_places=3)`),
+    por lo que filtros, ordenamientos, templates y exportaciones siguen trabajando
+    en segundos. En la base se almacena como `integer` (4 bytes): comparaciones
+    nativas e índices más chicos que con `numeric`.
+
+    Ojo: `Sum`/`Min`/`Max` conservan este campo como `output_field` y devuelven
+    segundos, pero `Avg('inicio')` (FloatField) y la aritmética con `F()`
+    (`F('fin') - F('inicio')`) devuelven los milisegundos crudos; hay que dividir
+    por 1000 (o pasar `output_field=MillisecondsField()`) para obtener segundos.
+    """
+    _QUANTUM = Decimal('0.001')
+    # Máximo en segundos: entra en `integer` (int4) una vez convertido a ms.
+    MAX_SECONDS = Decimal('999999.999')
+
+    @cached_property
+    def validators(self):
+        # Los validadores de rango heredados de IntegerField comparan contra el
+        # límite de int4 en ms, pero el valor validado está en segundos.
+        return [
+            MinValueValidator(Decimal('0')),
+            MaxValueValidator(self.MAX_SECONDS),
+            *self._validators,
+        ]
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return Decimal(value).scaleb(-3)
+
+    def to_python(self, value):
+        if value is None or value == '':
+            return None
+        try:
+            return Decimal(str(value)).quantize(self._QUANTUM, rounding=ROUND_HALF_UP)
+        except (InvalidOperation, ValueError):
+            raise ValidationError(
+                self.error_messages['invalid'], code='invalid', params={'value': value},
+            )
+
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        if value is None:
+            return None
+        seconds = self.to_python(value)
+        return int((seconds * 1000).to_integral_value(rounding=ROUND_HALF_UP))
+
+    def formfield(self, **kwargs):
+        return models.Field.formfield(self, **{
+            'form_class': forms.DecimalField,
+            'max_digits': 9,
+            'decimal_places': 3,
+            **kwargs,
+        })
+
+
 class Country(models.Model):
     """Catálogo de países.
 
@@ -76,6 +146,27 @@ class Tournament(models.Model):
         return f"{self.name} ({self.country})"
 
 
+def normalize_team_name(name):
+    """Nombre de equipo sin espacios extremos y en MAYÚSCULAS (no copia si ya lo está)."""
+    if not name:
+        return name
+    name = name.strip()
+    return name if name.isupper() else name.upper()
+
+
+class MatchManager(models.Manager):
+    def bulk_create_normalized(self, matches, batch_size=1000, **kwargs):
+        """`bulk_create` aplicando la misma normalización de equipos que `Match.save`.
+
+        Pensado para importaciones: evita pasar por `save()` partido a partido.
+        """
+        matches = list(matches)
+        for match in matches:
+            match.home_team = normalize_team_name(match.home_team)
+            match.away_team = normalize_team_name(match.away_team)
+        return self.bulk_create(matches, batch_size=batch_size, **kwargs)
+
+
 class Match(models.Model):
     """Partido específico entre dos equipos.
 
@@ -118,6 +209,8 @@ class Match(models.Model):
     away_score = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="Puntos Visitante")
     match_notes = models.TextField(blank=True, verbose_name="Notas")
 
+    objects = MatchManager()
+
     def __str__(self):  # Representación humana en admin y logs.
         return f"{self.home_team} vs. {self.away_team}"
 
@@ -132,9 +225,28 @@ class Match(models.Model):
                 name='match_teams_distinct',
                 check=~models.Q(home_team=models.F('away_team')),
             ),
+            # Parcial: con fecha NULL la unicidad no aplica igual (NULLs distintos en Postgres),
+            # así esas filas tampoco ocupan el índice.
             models.UniqueConstraint(
                 fields=['home_team', 'away_team', 'match_date'],
-                name='match_unique_teams_date'
+                condition=models.Q(match_date__isnull=False),
+                name='match_unique_teams_with_date'
+            ),
+        ]
+        indexes = [
+            # `home_team__iexact` compila a UPPER(col) = UPPER(%s): índice de expresión equivalente.
+            models.Index(Upper('home_team'), name='idx_match_home_upper'),
+            models.Index(Upper('away_team'), name='idx_match_away_upper'),
+            # Búsqueda libre por equipo (`icontains`) en el listado de partidos y la API;
+            # `icontains` compila a UPPER(col) LIKE UPPER(%s), por eso el trigrama va sobre UPPER.
+            GinIndex(OpClass(Upper('home_team'), name='gin_trgm_ops'), name='idx_match_home_upper_trgm'),
+            GinIndex(OpClass(Upper('away_team'), name='gin_trgm_ops'), name='idx_match_away_upper_trgm'),
+            # Parcial: listados/dashboards sólo consideran partidos analizados (con video),
+            # no los agendados del fixture; orden habitual por fecha descendente.
+            models.Index(
+                fields=['-match_date', '-created_at'],
+                condition=models.Q(video_id__isnull=False),
+                name='idx_match_analyzed_date',
             ),
         ]
 
@@ -144,18 +256,69 @@ class Match(models.Model):
         Esta limpieza asegura consistencia para filtros y evita duplicados
         por diferencias de casing. Se ejecuta antes de persistir.
         """
-        if self.home_team:
-            self.home_team = self.home_team.strip().upper()
-        if self.away_team:
-            self.away_team = self.away_team.strip().upper()
+        self.home_team = normalize_team_name(self.home_team)
+        self.away_team = normalize_team_name(self.away_team)
         super().save(*args, **kwargs)
 
+# Columnas de `Play` que no muestra la grilla de jugadas (DataTables): los listados las
+# difieren. Los endpoints de detalle/exportación deben usar el queryset completo (o `.undefer`).
+PLAY_LIST_DEFERRED = (
+    'ficha', 'acercar', 'alejar', 'jugadores', 'marcador_final', 'arbitro', 'nueva_categoria',
+)
+
+
+class PlayQuerySet(models.QuerySet):
+    def as_list(self):
+        """Difiere las columnas de texto que no se renderizan en listados (`PLAY_LIST_DEFERRED`)."""
+        return self.defer(*PLAY_LIST_DEFERRED)
+
+
+class PlayManager(models.Manager.from_queryset(PlayQuerySet)):
+    def bulk_load(self, plays, batch_size=1000):
+        """Inserta jugadas nuevas (sin guardar) en bloque.
+
+        En PostgreSQL usa `COPY ... FROM STDIN` (formato CSV): un único round-trip
+        y sin el parseo de un INSERT por fila, que con ~40 columnas e índices
+        domina la carga de un CSV de partido. Las constraints siguen validándose.
+        En otros backends cae a `bulk_create`. A diferencia de este último, con
+        COPY no se asignan los `pk` a las instancias.
+        """
+        plays = list(plays)
+        if not plays:
+            return 0
+        connection = connections[self.db]
+        if connection.vendor != 'postgresql':
+            self.bulk_create(plays, batch_size=batch_size)
+            return len(plays)
+
+        fields = [f for f in self.model._meta.concrete_fields if not f.primary_key]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)  # Todo entrecomillado: '' nunca se lee como NULL.
+        for play in plays:
+            writer.writerow([
+                f.get_db_prep_save(getattr(play, f.attname), connection) for f in fields
+            ])
+        buffer.seek(0)
+        sql = 'COPY {} ({}) FROM STDIN WITH (FORMAT csv)'.format(
+            connection.ops.quote_name(self.model._meta.db_table),
+            ', '.join(connection.ops.quote_name(f.column) for f in fields),
+        )
+        with transaction.atomic(using=self.db), connection.cursor() as cursor:
+            if hasattr(cursor.cursor, 'copy_expert'):  # psycopg2
+                cursor.copy_expert(sql, buffer)
+            else:  # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+        return len(plays)
+
+
 # Modelo de Jugada ÚNICO Y UNIFICADO
 class Play(models.Model):
     """Unidad mínima de análisis dentro de un `Match`.
 
     Representa un fragmento temporal etiquetado con atributos cualitativos y
-    cuantitativos (inicio / fin en segundos, evento, zona, participantes, etc.).
+    cuantitativos (inicio / fin en segundos, guardados como milisegundos enteros,
+    evento, zona, participantes, etc.).
     Muchos campos son opcionales y dependen de la granularidad del análisis.
     El conjunto de índices + constraints favorece consultas rápidas y calidad de datos.
     """
@@ -173,56 +336,72 @@ class Play(models.Model):
     zona = models.CharField(max_length=100, blank=True, verbose_name="Zona")  # Zona asociada a la jugada.
     evento = models.CharField(max_length=255, blank=True, verbose_name="Evento", db_index=True)  # Tipo general de evento.
     equipo = models.CharField(max_length=255, blank=True, verbose_name="Equipo", db_index=True)  # Equipo asociado.
-    fin = models.DecimalField(max_digits=9, decimal_places=3, verbose_name="Fin (segundos)", help_text="Segundo exacto de fin (ms)")  # Marca temporal final.
+    fin = MillisecondsField(verbose_name="Fin (segundos)", help_text="Segundo exacto de fin (hasta 3 decimales)")  # Marca temporal final.
     ficha = models.CharField(max_length=100, blank=True, verbose_name="Ficha")  # Referencia genérica (documento / etiqueta externa).
-    inicia = models.CharField(max_length=100, blank=True, verbose_name="Inicia", db_index=True)  # Actor / rol que inicia.
-    inicio = models.DecimalField(max_digits=9, decimal_places=3, verbose_name="Inicio (segundos)", help_text="Segundo exacto de inicio (ms)")  # Marca temporal inicial.
+    inicia = models.CharField(max_length=100, blank=True, verbose_name="Inicia")  # Actor / rol que inicia.
+    inicio = MillisecondsField(verbose_name="Inicio (segundos)", help_text="Segundo exacto de inicio (hasta 3 decimales)")  # Marca temporal inicial.
     marcador_final = models.CharField(max_length=50, blank=True, verbose_name="Marcador Final")  # Resultado inmediato de la jugada.
     termina = models.CharField(max_length=100, blank=True, verbose_name="Termina")  # Actor / rol que culmina.
     tiempo = models.CharField(max_length=50, blank=True, verbose_name="Tiempo")  # Periodización (1er tiempo / 2do, etc.).
-    torneo = models.CharField(max_length=255, blank=True, verbose_name="Torneo")  # DEPRECADO: usar `match.tournament`.
-    zona_fin = models.CharField(max_length=100, blank=True, verbose_name="Zona Fin", db_index=True)  # Ubicación final en el campo.
-    zona_inicio = models.CharField(max_length=100, blank=True, verbose_name="Zona Inicio", db_index=True)  # Ubicación inicial.
+    zona_fin = models.CharField(max_length=100, blank=True, verbose_name="Zona Fin")  # Ubicación final en el campo.
+    zona_inicio = models.CharField(max_length=100, blank=True, verbose_name="Zona Inicio")  # Ubicación inicial.
     resultado = models.CharField(max_length=100, blank=True, verbose_name="Resultado")  # Resultado cualitativo.
     jugadores = models.CharField(max_length=255, blank=True, verbose_name="Jugadores")  # Lista de jugadores involucrados.
     sigue_con = models.CharField(max_length=255, blank=True, verbose_name="Sigue Con")  # Acción / jugada subsiguiente.
     pos_tiro = models.CharField(max_length=100, blank=True, verbose_name="Pos Tiro")  # Posición de tiro si aplica.
-    set = models.CharField(max_length=100, blank=True, verbose_name="Set", db_index=True)  # Set / fase táctica.
+    set = models.CharField(max_length=100, blank=True, verbose_name="Set")  # Set / fase táctica.
     tiro = models.CharField(max_length=100, blank=True, verbose_name="Tiro")  # Tipo de tiro / lanzamiento.
-    tipo = models.CharField(max_length=100, blank=True, verbose_name="Tipo", db_index=True)  # Clasificación general.
-    accion = models.CharField(max_length=100, blank=True, verbose_name="Accion", db_index=True)  # Acción específica.
-    termina_en = models.CharField(max_length=100, blank=True, verbose_name="Termina En", db_index=True)  # Resultado espacial final.
-    sancion = models.CharField(max_length=100, blank=True, verbose_name="Sancion", db_index=True)  # Sanción asociada.
-    situacion = models.CharField(max_length=100, blank=True, verbose_name="Situacion", db_index=True)  # Situación táctica.
-    transicion = models.CharField(max_length=100, blank=True, verbose_name="Transicion", db_index=True)  # Tipo de transición.
-    situacion_penal = models.CharField(max_length=100, blank=True, verbose_name="Situación Penal", db_index=True)  # Nuevo: detalle penal.
-    nueva_categoria = models.CharField(max_length=100, blank=True, verbose_name="Nueva Categoría", db_index=True)  # Nuevo: clasificación complementaria.
+    tipo = models.CharField(max_length=100, blank=True, verbose_name="Tipo")  # Clasificación general.
+    accion = models.CharField(max_length=100, blank=True, verbose_name="Accion")  # Acción específica.
+    termina_en = models.CharField(max_length=100, blank=True, verbose_name="Termina En")  # Resultado espacial final.
+    sancion = models.CharField(max_length=100, blank=True, verbose_name="Sancion")  # Sanción asociada.
+    situacion = models.CharField(max_length=100, blank=True, verbose_name="Situacion")  # Situación táctica.
+    transicion = models.CharField(max_length=100, blank=True, verbose_name="Transicion")  # Tipo de transición.
+    situacion_penal = models.CharField(max_length=100, blank=True, verbose_name="Situación Penal")  # Nuevo: detalle penal.
+    nueva_categoria = models.CharField(max_length=100, blank=True, verbose_name="Nueva Categoría")  # Nuevo: clasificación complementaria.
     acercar = models.CharField(max_length=50, blank=True, verbose_name="Acercar")  # Flag / instrucción visual.
     alejar = models.CharField(max_length=50, blank=True, verbose_name="Alejar")  # Flag / instrucción visual.
 
+    objects = PlayManager()
+
     def __str__(self):  # Provee etiqueta rápida en listados.
         return f"{self.jugada} - {self.equipo}"
 
+    @property
+    def torneo(self):
+        """Nombre del torneo del partido (reemplaza la antigua columna de texto `torneo`).
+
+        Compatibilidad con exportaciones/serializers; en listados combinar con
+        `select_related('match__tournament')` para no consultar por fila.
+        """
+        return self.match.tournament.name if self.match.tournament_id else ''
+
     class Meta:
         verbose_name = "Jugada"
         verbose_name_plural = "Jugadas"
-        # Orden por defecto por inicio
-        ordering = ['inicio']
+        # Sin `ordering` por defecto: agregaciones y conteos no pagan un ORDER BY;
+        # los listados ordenan explícitamente con `.order_by('inicio')`.
         # Índices para acelerar consultas habituales
         indexes = [
-            models.Index(fields=['match', 'inicio'], name='idx_play_match_inicio'),
-            models.Index(fields=['evento'], name='idx_play_evento'),
-            models.Index(fields=['equipo'], name='idx_play_equipo'),
-            models.Index(fields=['zona_inicio'], name='idx_play_zona_inicio'),
-            models.Index(fields=['zona_fin'], name='idx_play_zona_fin'),
-            models.Index(fields=['inicia'], name='idx_play_inicia'),
-            # Índices nuevos útiles
-            models.Index(fields=['situacion'], name='idx_play_situacion'),
-            models.Index(fields=['tipo'], name='idx_play_tipo'),
-            models.Index(fields=['accion'], name='idx_play_accion'),
-            models.Index(fields=['termina_en'], name='idx_play_termina_en'),
-            models.Index(fields=['sancion'], name='idx_play_sancion'),
-            models.Index(fields=['transicion'], name='idx_play_transicion'),
+            # Cubriente: el listado/timeline de un partido (orden por inicio) se resuelve con index-only scan.
+            models.Index(fields=['match', 'inicio'], name='idx_play_match_inicio_cov', include=['id', 'fin', 'evento', 'equipo', 'jugada']),
+            # BRIN: las jugadas de un partido se insertan juntas (COPY) y crecen en `inicio`;
+            # ocupa una fracción del B-tree y sirve para barridos de partidos completos.
+            BrinIndex(fields=['match', 'inicio'], name='idx_play_match_inicio_brin', pages_per_range=32),
+            # Compuestos según las consultas reales: partido + 1-2 categóricos, ordenado por inicio.
+            # El INCLUDE permite index-only scans al listar jugadas de un equipo (jugada/fin).
+            models.Index(fields=['match', 'equipo', 'inicio'], name='idx_play_match_equipo_inicio', include=['fin', 'jugada']),
+            models.Index(fields=['match', 'evento', 'inicio'], name='idx_play_match_evento_inicio'),
+            models.Index(fields=['match', 'zona_inicio', 'zona_fin'], name='idx_play_match_zonas'),
+            # Las estadísticas filtran `match_id=... , equipo__iexact=...`: UPPER(equipo) por partido.
+            models.Index(models.F('match'), Upper('equipo'), name='idx_play_match_equipo_upper'),
+            # `jugada__iexact` (POSESION, SALIDAS, PENALES_CONCEDIDOS, ...) por partido o lista de partidos.
+            models.Index(models.F('match'), Upper('jugada'), name='idx_play_match_jugada_upper'),
+            # Trigramas (pg_trgm) sobre UPPER(col): es la expresión que genera `icontains`
+            # en PostgreSQL, así los filtros de jugada/evento/jugadores pueden usar el índice.
+            GinIndex(OpClass(Upper('jugada'), name='gin_trgm_ops'), name='idx_play_jugada_upper_trgm'),
+            GinIndex(OpClass(Upper('evento'), name='gin_trgm_ops'), name='idx_play_evento_upper_trgm'),
+            GinIndex(OpClass(Upper('jugadores'), name='gin_trgm_ops'), name='idx_play_jugadores_upper_trgm'),
         ]
         # Reglas de integridad sobre tiempos
         constraints = [
@@ -240,6 +419,40 @@ class Play(models.Model):
             ),
         ]
         
+TEAM_LOOKUP_CACHE_KEY = 'player:team_lookup'
+TEAM_LOOKUP_CACHE_TTL = 300  # Acota la desincronización entre procesos (la invalidación es local).
+
+
+class TeamManager(models.Manager):
+    def lookup_map(self):
+        """Mapa {NOMBRE o ALIAS normalizado: Team} cacheado en `django.core.cache`.
+
+        El catálogo es chico y casi no cambia, pero vistas y stats lo consultan por
+        nombre en cada request. El nombre tiene prioridad sobre un alias coincidente.
+        """
+        try:
+            mapping = cache.get(TEAM_LOOKUP_CACHE_KEY)
+        except Exception:
+            mapping = None
+        if mapping is None:
+            teams = list(self.only('id', 'name', 'alias'))
+            mapping = {}
+            for attr in ('name', 'alias'):
+                for team in teams:
+                    key = normalize_team_name(getattr(team, attr))
+                    if key:
+                        mapping.setdefault(key, team)
+            try:
+                cache.set(TEAM_LOOKUP_CACHE_KEY, mapping, TEAM_LOOKUP_CACHE_TTL)
+            except Exception:
+                pass
+        return mapping
+
+    def get_cached(self, name):
+        """`Team` cuyo nombre o alias coincide (sin distinguir mayúsculas) o `None`."""
+        return self.lookup_map().get(normalize_team_name(name))
+
+
 class Team(models.Model):
     """Catálogo de equipos (clubes / selecciones).
 
@@ -248,6 +461,8 @@ class Team(models.Model):
     name = models.CharField(max_length=100, unique=True, verbose_name="Nombre del Equipo")  # Nombre completo.
     alias = models.CharField(max_length=50, unique=True, blank=True, null=True, verbose_name="Alias/Nombre abreviado")  # Siglas opcionales.
 
+    objects = TeamManager()
+
     def __str__(self):  # Facilita visualización en admin.
         return self.name
 
@@ -255,12 +470,37 @@ class Team(models.Model):
         verbose_name = "Equipo"
         verbose_name_plural = "Equipos"
         
+class ProfileManager(models.Manager):
+    def bulk_ensure(self, users, batch_size=500):
+        """Crea en lote los `Profile` faltantes para `users` (instancias o IDs).
+
+        Pensado para altas masivas (`User.objects.bulk_create` no dispara `post_save`):
+        un SELECT para detectar los existentes y un `bulk_create` para el resto.
+        Devuelve la cantidad de perfiles creados.
+        """
+        user_ids = {getattr(u, 'pk', u) for u in users}
+        if not user_ids:
+            return 0
+        existing = set(self.filter(user_id__in=user_ids).values_list('user_id', flat=True))
+        missing = user_ids - existing
+        self.bulk_create(
+            [self.model(user_id=user_id) for user_id in missing],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        return len(missing)
+
+
 class Profile(models.Model):
     """Extiende al usuario con rol y equipo principal.
 
     OneToOne para mantener una única ficha por usuario. `team` es opcional
     porque un entrenador puede gestionar múltiples equipos a través de
     `CoachTournamentTeamParticipation`.
+
+    Guardar un `User` no vuelve a guardar su `Profile`: si en el futuro algún
+    campo del perfil deriva del usuario, debe actualizarse explícitamente en el
+    flujo que guarda al usuario.
     """
     class Role(models.TextChoices):
         ENTRENADOR = 'COACH', 'Entrenador'
@@ -270,6 +510,8 @@ class Profile(models.Model):
     team = models.ForeignKey(Team, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="Equipo")  # Equipo principal (si aplica).
     role = models.CharField(max_length=10, choices=Role.choices, default=Role.ENTRENADOR, verbose_name="Rol")  # Rol operativo.
 
+    objects = ProfileManager()
+
     def __str__(self):  # Ayuda en listados admin.
         return f"Perfil de {self.user.username}"
 
@@ -277,26 +519,33 @@ class Profile(models.Model):
         verbose_name = "Perfil"
         verbose_name_plural = "Perfiles"
 
-# Crear perfil automáticamente al crear un usuario y mantenerlo sincronizado
-@receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
-    """Crea el `Profile` automáticamente al generar un nuevo `User`.
+@receiver([post_save, post_delete], sender=Team)
+def invalidate_team_lookup(sender, **kwargs):
+    """Descarta el mapa cacheado de `TeamManager.lookup_map` al modificar equipos."""
+    try:
+        cache.delete(TEAM_LOOKUP_CACHE_KEY)
+    except Exception:
+        pass
 
-    Se usa `get_or_create` para tolerar escenarios donde la creación pueda
-    dispararse desde múltiples lugares (e.g., admin con inlines).
-    """
-    if created:
-        Profile.objects.get_or_create(user=instance)
 
+# Crear perfil automáticamente al crear un usuario.
+# Para altas masivas usar `Profile.objects.bulk_ensure(users)` (bulk_create no dispara señales).
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Garantiza que cambios en `User` propaguen persistencia en `Profile`.
+def create_user_profile(sender, instance, created, **kwargs):
+    """Crea el `Profile` automáticamente al generar un nuevo `User`.
 
-    Evita estados inconsistentes si se modifican atributos relevantes en el usuario
-    que deban reflejarse en el perfil (aunque por ahora no hay campos dependientes directos).
+    Como sólo corre con `created=True`, se inserta directamente (sin el SELECT
+    previo de `get_or_create`); si el perfil ya fue creado por otro camino
+    (e.g., admin con inlines) se ignora el `IntegrityError` dentro de un savepoint.
+    Se omite en cargas de fixtures (`raw`), donde el perfil viene en los propios datos.
     """
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
+    if not created or kwargs.get('raw'):
+        return
+    try:
+        with transaction.atomic():
+            Profile.objects.create(user=instance)
+    except IntegrityError:
+        pass
 
 class CoachTournamentTeamParticipation(models.Model):
     """Asignación de entrenador a equipo por temporada.
@@ -325,18 +574,22 @@ class SelectionPreset(models.Model):
 
     Permite a un usuario guardar subconjuntos de `Play` para análisis repetido,
     presentaciones, clips o exportaciones. `play_ids` almacena una lista ordenada
-    (intended) de IDs de jugadas para reconstruir rápidamente la selección.
+    (intended) de IDs de jugadas como arreglo nativo de Postgres, indexado con GIN.
     """
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='selection_presets')  # Propietario.
     match = models.ForeignKey('player.Match', on_delete=models.CASCADE, related_name='selection_presets')  # Partido origen.
     name = models.CharField(max_length=100)  # Nombre identificador único dentro del mismo usuario+partido.
-    play_ids = models.JSONField(default=list)  # Lista de IDs de `Play` en orden significativo.
+    play_ids = ArrayField(models.BigIntegerField(), default=list, blank=True)  # IDs de `Play` en orden significativo (int8[]).
     created_at = models.DateTimeField(auto_now_add=True)  # Creación.
     updated_at = models.DateTimeField(auto_now=True)  # Última modificación.
 
     class Meta:
         unique_together = ('user', 'match', 'name')
         ordering = ['-updated_at']
+        indexes = [
+            # GIN para consultas de pertenencia/solapamiento (`play_ids__contains`, `__overlap`).
+            GinIndex(fields=['play_ids'], name='idx_preset_play_ids'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user.username} - match {self.match_id})"
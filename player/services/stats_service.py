@@ -5,12 +5,13 @@ Contiene toda la lógica de cálculo de métricas, tendencias y análisis
 de partidos y jugadas para los dashboards de entrenadores.
 """
 import logging
+import re
 
-from django.db.models import Count, Q, F, Avg, Sum, Case, When, IntegerField, CharField, Value
+from django.db.models import Count, Q, F, Avg, Max, Sum, Case, When, IntegerField, CharField, Value
 from django.core.cache import cache
 import hashlib
 from django.db.models.functions import Coalesce, Upper
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Optional, List, Dict, Any
 from datetime import date, timedelta
 
@@ -23,6 +24,22 @@ STATS_CACHE_TTL = 300
 MATCH_CACHE_TTL = 900
 SEASON_CACHE_TTL = 3600
 
+# Marcador final "X - Y" (local - visitante), con o sin espacios
+SCORE_RE = re.compile(r'^\s*(\d+)\s*-\s*(\d+)\s*$')
+
+# Filtros de jugadas reutilizados por las distintas métricas (los Q no se mutan al combinarlos)
+LINE_FILTER = Q(jugada__icontains='LINE')
+SCRUM_FILTER = Q(jugada__icontains='SCRUM')
+TRIES_FILTER = Q(jugada__iexact='TRIES') | Q(jugada__icontains='TRY')
+POSSESSION_FILTER = Q(jugada__iexact='POSESION')
+PENALES_CONCEDIDOS_FILTER = Q(jugada__iexact='PENALES_CONCEDIDOS')
+SALIDAS_FILTER = Q(jugada__iexact='SALIDAS')
+WIN_CLEAN_FILTER = Q(resultado__iexact='GANA')
+WIN_DIRTY_FILTER = Q(resultado__icontains='GANA SUCIO')
+WIN_ANY_FILTER = WIN_CLEAN_FILTER | WIN_DIRTY_FILTER
+GANA_FILTER = Q(resultado__icontains='GANA')
+LOSE_FILTER = Q(resultado__icontains='PIERDE')
+
 
 class StatsService:
     """Servicio centralizado para cálculos estadísticos."""
@@ -41,7 +58,18 @@ class StatsService:
         self.seasons = seasons or []
         self.tournament_ids = tournaments or []
         self._team_names = set()
+        # Memo por instancia (un request): marcador y tries por partido no cambian
+        # entre los métodos que los consultan para los mismos match_ids.
+        self._score_cache: Dict[int, tuple] = {}
+        self._tries_cache: Dict[tuple, int] = {}
+        self._tries_loaded: set[int] = set()
+        # Querysets base de partidos por `include_tournament_filter` (se clonan al devolverlos)
+        self._base_matches_qs: Dict[bool, Any] = {}
         self._init_team_context()
+        # Fijos tras resolver el contexto: frozenset para pertenencia y tupla ordenada
+        # para los `__in` y la clave de caché.
+        self._team_names = frozenset(self._team_names)
+        self._team_names_list = tuple(sorted(self._team_names))
 
     def _normalize_team_name(self, value: Optional[str]) -> str:
         return (value or '').strip().upper()
@@ -60,9 +88,7 @@ class StatsService:
             variants.add(normalized_name)
 
         if team is None and normalized_name:
-            matched_team = Team.objects.filter(
-                Q(name__iexact=team_name) | Q(alias__iexact=team_name)
-            ).only('name', 'alias').first()
+            matched_team = Team.objects.get_cached(team_name)
             if matched_team:
                 variants.update(self._get_team_variants(team=matched_team))
 
@@ -77,7 +103,7 @@ class StatsService:
         user_id = getattr(self.user, 'id', None)
         parts.append(f"user:{user_id or 'anon'}")
         if self._team_names:
-            parts.append("teams:" + ",".join(sorted(self._team_names)))
+            parts.append("teams:" + ",".join(self._team_names_list))
         if self.seasons:
             parts.append("seasons:" + ",".join(sorted(self.seasons)))
         if self.tournament_ids:
@@ -140,37 +166,42 @@ class StatsService:
 
     def _get_base_matches_queryset(self, include_tournament_filter: bool = True):
         """Retorna el queryset base de partidos según contexto."""
+        cached_qs = self._base_matches_qs.get(include_tournament_filter)
+        if cached_qs is not None:
+            return cached_qs.all()
+
         qs = Match.objects.select_related('tournament', 'tournament__country')
 
         # Solo partidos con video/datos cargados; los del fixture sin contenido no aportan estadísticas
         qs = qs.filter(video_id__isnull=False).exclude(video_id='')
         
-        # Filtrar por equipo
+        # Filtrar por equipo: `_team_names` ya está en mayúsculas, así que un IN sobre
+        # UPPER(col) reemplaza la cadena de `iexact` y usa los índices de expresión.
         if self._team_names:
-            team_q = Q()
-            for name in self._team_names:
-                team_q |= Q(home_team__iexact=name) | Q(away_team__iexact=name)
-            qs = qs.filter(team_q)
+            names = self._team_names_list
+            qs = qs.alias(
+                home_team_upper=Upper('home_team'),
+                away_team_upper=Upper('away_team'),
+            ).filter(Q(home_team_upper__in=names) | Q(away_team_upper__in=names))
         
         # Filtrar por temporadas si se especificaron
         if self.seasons:
-            season_q = Q()
-            for s in self.seasons:
-                season_q |= Q(tournament__season__iexact=s)
-            qs = qs.filter(season_q)
+            seasons = sorted({(s or '').upper() for s in self.seasons})
+            qs = qs.alias(season_upper=Upper('tournament__season')).filter(season_upper__in=seasons)
 
         # Filtrar por torneos seleccionados (por nombre/short_name, sin importar temporada)
         if include_tournament_filter and self.tournament_ids:
-            tournament_q = Q()
-            for t in self.tournament_ids:
-                t_norm = (t or '').strip()
-                if not t_norm:
-                    continue
-                tournament_q |= Q(tournament__name__iexact=t_norm) | Q(tournament__short_name__iexact=t_norm)
-            if tournament_q:
-                qs = qs.filter(tournament_q)
+            tournaments = sorted({(t or '').strip().upper() for t in self.tournament_ids} - {''})
+            if tournaments:
+                qs = qs.alias(
+                    tournament_name_upper=Upper('tournament__name'),
+                    tournament_short_upper=Upper('tournament__short_name'),
+                ).filter(
+                    Q(tournament_name_upper__in=tournaments) | Q(tournament_short_upper__in=tournaments)
+                )
         
-        return qs
+        self._base_matches_qs[include_tournament_filter] = qs
+        return qs.all()
 
     def _get_base_plays_queryset(self, match_ids: Optional[List[int]] = None):
         """Retorna el queryset base de jugadas."""
@@ -190,6 +221,9 @@ class StatsService:
         Returns:
             tuple (home_score, away_score) o (None, None) si no hay marcador
         """
+        if match_id in self._score_cache:
+            return self._score_cache[match_id]
+
         # Obtener la última jugada con marcador_final del partido
         last_play = Play.objects.filter(
             match_id=match_id
@@ -198,29 +232,72 @@ class StatsService:
         ).order_by('-fin').first()
         
         if not last_play or not last_play.marcador_final:
+            score = (None, None)
+        else:
+            score = self._parse_score(last_play.marcador_final)
+        self._score_cache[match_id] = score
+        return score
+
+    @staticmethod
+    def _parse_score(marcador: str) -> tuple:
+        """Convierte "13 - 25" / "13-25" en (13, 25); (None, None) si no se puede parsear."""
+        match = SCORE_RE.match(marcador or '')
+        if not match:
             return None, None
-        
-        try:
-            # Formato esperado: "13 - 25" o "13-25"
-            marcador = last_play.marcador_final.strip()
-            parts = marcador.split('-')
-            if len(parts) == 2:
-                home_score = int(parts[0].strip())
-                away_score = int(parts[1].strip())
-                return home_score, away_score
-        except (ValueError, IndexError):
-            pass
-        
-        return None, None
+        return int(match.group(1)), int(match.group(2))
+
+    def _scores_by_match(self, match_ids: List[int]) -> Dict[int, tuple]:
+        """Marcador (home, away) de varios partidos en una sola consulta.
+
+        Mismo criterio que `_parse_marcador_final` (última jugada con marcador por `fin`),
+        resuelto con DISTINCT ON (match_id) en lugar de una consulta por partido.
+        """
+        pending = [mid for mid in match_ids if mid not in self._score_cache]
+        if pending:
+            rows = (
+                Play.objects.filter(match_id__in=pending)
+                .exclude(marcador_final='')
+                .order_by('match_id', '-fin')
+                .distinct('match_id')
+                .values_list('match_id', 'marcador_final')
+            )
+            found = {match_id: self._parse_score(marcador) for match_id, marcador in rows}
+            for mid in pending:
+                self._score_cache[mid] = found.get(mid, (None, None))
+        return {mid: self._score_cache[mid] for mid in match_ids}
+
+    def _tries_by_match(self, match_ids: List[int]) -> Dict[tuple, int]:
+        """Tries por (match_id, EQUIPO en mayúsculas) en una sola consulta agrupada.
+
+        Mismo filtro que `_count_tries`; buscar con `(match_id, nombre.strip().upper())`.
+        """
+        pending = [mid for mid in match_ids if mid not in self._tries_loaded]
+        if pending:
+            rows = (
+                Play.objects.filter(match_id__in=pending)
+                .filter(TRIES_FILTER)
+                .exclude(equipo='')  # `_count_tries` devuelve 0 para nombre vacío
+                .values('match_id', equipo_upper=Upper('equipo'))
+                .annotate(count=Count('id'))
+            )
+            for row in rows:
+                self._tries_cache[(row['match_id'], row['equipo_upper'])] = row['count']
+            self._tries_loaded.update(pending)
+        wanted = set(match_ids)
+        return {key: count for key, count in self._tries_cache.items() if key[0] in wanted}
 
-    def _get_match_result(self, match_id: int, home_team: str, away_team: str) -> dict:
+    def _get_match_result(self, match_id: int, home_team: str, away_team: str, score: Optional[tuple] = None) -> dict:
         """
         Determina el resultado de un partido usando marcador_final.
+
+        `score` permite pasar el (home, away) ya resuelto en bloque (`_scores_by_match`).
         
         Returns:
             dict con: result ('W', 'L', 'D'), team_score, opp_score, is_home, score_str
         """
-        home_score, away_score = self._parse_marcador_final(match_id)
+        if score is None:
+            score = self._parse_marcador_final(match_id)
+        home_score, away_score = score
         
         is_home = home_team.upper() in self._team_names
         is_away = away_team.upper() in self._team_names
@@ -263,18 +340,29 @@ class StatsService:
 
     def get_available_seasons(self) -> List[str]:
         """Retorna las temporadas disponibles para el usuario."""
+        cache_key = self._make_cache_key('available_seasons')
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         matches = self._get_base_matches_queryset(include_tournament_filter=False)
-        seasons = matches.exclude(
+        seasons = list(matches.exclude(
             tournament__season__isnull=True
         ).exclude(
             tournament__season=''
         ).values_list(
             'tournament__season', flat=True
-        ).distinct().order_by('-tournament__season')
-        return list(seasons)
+        ).distinct().order_by('-tournament__season'))
+        self._cache_set(cache_key, seasons, STATS_CACHE_TTL)
+        return seasons
 
     def get_available_tournaments(self) -> List[Dict[str, Any]]:
         """Retorna torneos disponibles (únicos por nombre), sin distinguir temporada."""
+        cache_key = self._make_cache_key('available_tournaments')
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         matches = self._get_base_matches_queryset(include_tournament_filter=False)
         tournaments = matches.exclude(tournament__isnull=True).values(
             'tournament__name',
@@ -286,6 +374,7 @@ class StatsService:
                 'name': t['tournament__name'],
                 'short_name': t['tournament__short_name'],
             })
+        self._cache_set(cache_key, result, STATS_CACHE_TTL)
         return result
 
     def get_season_aggregates(self) -> Dict[str, Any]:
@@ -298,6 +387,11 @@ class StatsService:
         matches = list(self._get_base_matches_queryset(include_tournament_filter=False).select_related('tournament'))
         aggregates = {}
 
+        # Precarga en bloque: `_get_match_result` y `_count_tries` leen del memo de la instancia
+        match_ids = [match.id for match in matches]
+        self._scores_by_match(match_ids)
+        self._tries_by_match(match_ids)
+
         for match in matches:
             season = match.tournament.season if match.tournament else 'N/A'
             if season not in aggregates:
@@ -342,24 +436,20 @@ class StatsService:
         if not team_name:
             return 0
         normalized = team_name.strip().upper()
-        return Play.objects.filter(
-            match_id=match_id,
-            equipo__iexact=normalized
-        ).filter(
-            Q(jugada__iexact='TRIES') | Q(jugada__icontains='TRY')
-        ).count()
-
-    def _count_penalties_conceded(self, match_id: int, team_name: str) -> int:
-        """Cuenta penales concedidos por equipo en un partido (jugada=penales_concedidos)."""
-        if not team_name:
+        key = (match_id, normalized)
+        if key in self._tries_cache:
+            return self._tries_cache[key]
+        if match_id in self._tries_loaded:
+            # El partido ya se cargó en bloque (`_tries_by_match`): sin fila = 0 tries
             return 0
-        normalized = team_name.strip().upper()
-        return Play.objects.filter(
+        count = Play.objects.filter(
             match_id=match_id,
             equipo__iexact=normalized
         ).filter(
-            Q(jugada__iexact='PENALES_CONCEDIDOS') | Q(jugada__icontains='PENALES_CONCEDIDOS')
+            TRIES_FILTER
         ).count()
+        self._tries_cache[key] = count
+        return count
 
     def get_summary_stats(self) -> Dict[str, Any]:
         """
@@ -385,41 +475,39 @@ class StatsService:
         tries_for = 0
         tries_against = 0
         
-        # Análisis por partido usando marcador_final
+        # Marcadores y tries de todos los partidos en dos consultas (no 3 por partido)
+        match_ids = [m['id'] for m in match_list]
+        scores = self._scores_by_match(match_ids)
+        tries = self._tries_by_match(match_ids)
+
+        # Tally por partido sobre los datos ya cargados, sin armar el dict de `_get_match_result`
+        team_names = self._team_names
         for match_data in match_list:
-            result_data = self._get_match_result(
-                match_data['id'],
-                match_data['home_team'],
-                match_data['away_team']
-            )
-            
-            if result_data['result'] == 'W':
-                wins += 1
-            elif result_data['result'] == 'L':
-                losses += 1
-            else:
+            match_id = match_data['id']
+            home_team = match_data['home_team'] or ''
+            away_team = match_data['away_team'] or ''
+            is_home = home_team.upper() in team_names
+            team_name, opp_name = (home_team, away_team) if is_home else (away_team, home_team)
+
+            home_score, away_score = scores.get(match_id, (None, None))
+            if home_score is None or away_score is None:
+                # Sin marcador cuenta como empate, igual que `_get_match_result`
                 draws += 1
-            
-            if result_data['has_score']:
-                points_for += result_data['team_score']
-                points_against += result_data['opp_score']
-
-            # Log de tries por partido (para debug)
-            is_home = result_data['is_home']
-            team_name = match_data['home_team'] if is_home else match_data['away_team']
-            opp_name = match_data['away_team'] if is_home else match_data['home_team']
-            team_tries_match = self._count_tries(match_data['id'], team_name)
-            opp_tries_match = self._count_tries(match_data['id'], opp_name)
-            logger.info(
-                "[TRY_DEBUG] match=%s home=%s away=%s team=%s opp=%s team_tries=%s opp_tries=%s",
-                match_data['id'], match_data['home_team'], match_data['away_team'],
-                team_name, opp_name, team_tries_match, opp_tries_match
-            )
+            else:
+                team_score, opp_score = (home_score, away_score) if is_home else (away_score, home_score)
+                if team_score > opp_score:
+                    wins += 1
+                elif team_score < opp_score:
+                    losses += 1
+                else:
+                    draws += 1
+                points_for += team_score
+                points_against += opp_score
 
             # Sumar tries por partido para el agregado final
-            if self._team_names:
-                tries_for += team_tries_match
-                tries_against += opp_tries_match
+            if team_names:
+                tries_for += tries.get((match_id, team_name.strip().upper()), 0)
+                tries_against += tries.get((match_id, opp_name.strip().upper()), 0)
 
         avg_points_per_match = round(points_for / total, 1) if total > 0 else 0
         avg_tries_per_match = round(tries_for / total, 1) if total > 0 else 0
@@ -449,7 +537,17 @@ class StatsService:
         if cached is not None:
             return cached
 
-        matches = self._get_base_matches_queryset().order_by('-match_date', '-created_at')[:limit]
+        matches = list(self._get_base_matches_queryset().order_by('-match_date', '-created_at')[:limit])
+
+        # Precarga en bloque: `_get_match_result` y `_count_tries` leen del memo de la instancia
+        match_ids = [match.id for match in matches]
+        self._scores_by_match(match_ids)
+        self._tries_by_match(match_ids)
+        # Cantidad de jugadas de los N partidos en una consulta agrupada
+        plays_counts = dict(
+            Play.objects.filter(match_id__in=match_ids)
+            .values_list('match_id').annotate(count=Count('id')).order_by()
+        )
         
         result = []
         for match in matches:
@@ -461,7 +559,7 @@ class StatsService:
                 match.away_team
             )
             
-            plays_count = Play.objects.filter(match=match).count()
+            plays_count = plays_counts.get(match.id, 0)
             
             # Contar tries
             team_name = match.home_team if result_data['is_home'] else match.away_team
@@ -512,50 +610,56 @@ class StatsService:
 
         plays_for_team = plays.filter(team_q) if team_q else plays
         
-        # Por tipo de jugada
-        by_jugada = plays.exclude(jugada='').values('jugada').annotate(
-            count=Count('id')
-        ).order_by('-count')[:10]
-        
-        # Por evento
-        by_evento = plays.exclude(evento='').values('evento').annotate(
-            count=Count('id')
-        ).order_by('-count')[:10]
-        
-        # Por resultado
-        by_resultado = plays.exclude(resultado='').values('resultado').annotate(
-            count=Count('id')
-        ).order_by('-count')[:10]
-        
-        # Por zona de inicio
-        by_zona_inicio = plays.exclude(zona_inicio='').values('zona_inicio').annotate(
-            count=Count('id')
-        ).order_by('-count')
-        
-        # Por zona de fin
-        by_zona_fin = plays.exclude(zona_fin='').values('zona_fin').annotate(
-            count=Count('id')
-        ).order_by('-count')
-
-        # Lines ganados / perdidos (jugada LINE/lines, resultado gana|gana sucio vs pierde)
-        line_jugada_filter = Q(jugada__iexact='LINE') | Q(jugada__iexact='LINES') | Q(jugada__icontains='LINE')
-        line_won_result_filter = Q(resultado__iexact='GANA') | Q(resultado__iexact='GANA SUCIO') | Q(resultado__icontains='GANA SUCIO')
-        line_lost_result_filter = Q(resultado__iexact='PIERDE') | Q(resultado__icontains='PIERDE')
-
-        lines_won = plays_for_team.filter(line_jugada_filter).filter(line_won_result_filter).count()
-        lines_lost = plays_for_team.filter(line_jugada_filter).filter(line_lost_result_filter).count()
-
-        # Scrums ganados / perdidos (jugada SCRUMS, resultado gana vs pierde)
-        scrum_jugada_filter = Q(jugada__iexact='SCRUMS') | Q(jugada__icontains='SCRUM')
-        scrum_won_result_filter = Q(resultado__iexact='GANA') | Q(resultado__iexact='GANA SUCIO') | Q(resultado__icontains='GANA SUCIO') | Q(resultado__icontains='GANA')
-        scrum_lost_result_filter = Q(resultado__iexact='PIERDE') | Q(resultado__icontains='PIERDE')
-
-        scrums_won = plays_for_team.filter(scrum_jugada_filter).filter(scrum_won_result_filter).count()
-        scrums_lost = plays_for_team.filter(scrum_jugada_filter).filter(scrum_lost_result_filter).count()
+        # Un solo recorrido de las jugadas alimenta los cinco conteos por columna
+        # (antes, un GROUP BY por columna sobre el mismo queryset).
+        by_column = {
+            'jugada': Counter(),
+            'evento': Counter(),
+            'resultado': Counter(),
+            'zona_inicio': Counter(),
+            'zona_fin': Counter(),
+        }
+        jugada_counts = by_column['jugada']
+        evento_counts = by_column['evento']
+        resultado_counts = by_column['resultado']
+        zona_inicio_counts = by_column['zona_inicio']
+        zona_fin_counts = by_column['zona_fin']
+        rows_seen = 0
+        for jugada, evento, resultado, zona_inicio, zona_fin in plays.values_list(
+            'jugada', 'evento', 'resultado', 'zona_inicio', 'zona_fin'
+        ).iterator(chunk_size=5000):
+            rows_seen += 1
+            if jugada:
+                jugada_counts[jugada] += 1
+            if evento:
+                evento_counts[evento] += 1
+            if resultado:
+                resultado_counts[resultado] += 1
+            if zona_inicio:
+                zona_inicio_counts[zona_inicio] += 1
+            if zona_fin:
+                zona_fin_counts[zona_fin] += 1
+
+        def ranked(column, limit=None):
+            return [{column: value, 'count': count} for value, count in by_column[column].most_common(limit)]
+
+        # Lines ganados / perdidos (resultado gana|gana sucio vs pierde) y scrums ganados /
+        # perdidos (gana vs pierde): los cuatro conteos en una sola consulta (COUNT ... FILTER)
+        set_pieces = plays_for_team.aggregate(
+            lines_won=Count('id', filter=LINE_FILTER & WIN_ANY_FILTER),
+            lines_lost=Count('id', filter=LINE_FILTER & LOSE_FILTER),
+            scrums_won=Count('id', filter=SCRUM_FILTER & GANA_FILTER),
+            scrums_lost=Count('id', filter=SCRUM_FILTER & LOSE_FILTER),
+        )
+        lines_won = set_pieces['lines_won']
+        lines_lost = set_pieces['lines_lost']
+        scrums_won = set_pieces['scrums_won']
+        scrums_lost = set_pieces['scrums_lost']
+        total_plays = rows_seen
 
         # Penales concedidos por zona de inicio
         penales_by_zone_qs = plays_for_team.filter(
-            Q(jugada__iexact='PENALES_CONCEDIDOS')
+            PENALES_CONCEDIDOS_FILTER
         ).exclude(zona_inicio='').values('zona_inicio').annotate(
             count=Count('id')
         ).order_by('-count')
@@ -563,7 +667,7 @@ class StatsService:
 
         # Penales concedidos por situacion_penal
         penales_by_situacion = list(
-            plays_for_team.filter(Q(jugada__iexact='PENALES_CONCEDIDOS'))
+            plays_for_team.filter(PENALES_CONCEDIDOS_FILTER)
             .exclude(situacion_penal='')
             .values('situacion_penal').annotate(count=Count('id'))
             .order_by('-count')
@@ -571,19 +675,19 @@ class StatsService:
 
         # Penales concedidos por tipo
         penales_by_tipo = list(
-            plays_for_team.filter(Q(jugada__iexact='PENALES_CONCEDIDOS'))
+            plays_for_team.filter(PENALES_CONCEDIDOS_FILTER)
             .exclude(tipo='')
             .values('tipo').annotate(count=Count('id'))
             .order_by('-count')
         )
         
         data = {
-            'by_jugada': list(by_jugada),
-            'by_evento': list(by_evento),
-            'by_resultado': list(by_resultado),
-            'by_zona_inicio': list(by_zona_inicio),
-            'by_zona_fin': list(by_zona_fin),
-            'total_plays': plays.count(),
+            'by_jugada': ranked('jugada', 10),
+            'by_evento': ranked('evento', 10),
+            'by_resultado': ranked('resultado', 10),
+            'by_zona_inicio': ranked('zona_inicio'),
+            'by_zona_fin': ranked('zona_fin'),
+            'total_plays': total_plays,
             'lineouts': {
                 'won': lines_won,
                 'lost': lines_lost,
@@ -631,16 +735,19 @@ class StatsService:
         zone_starts = defaultdict(int)
         zone_ends = defaultdict(int)
         
-        for play in plays.values('zona_inicio', 'zona_fin'):
-            zi = (play['zona_inicio'] or '').upper().strip()
-            zf = (play['zona_fin'] or '').upper().strip()
+        # La base agrupa por par (zona_inicio, zona_fin) y devuelve sólo los pares
+        # distintos; la normalización se aplica sobre esas pocas filas.
+        pairs = plays.values_list('zona_inicio', 'zona_fin').annotate(count=Count('id')).order_by()
+        for zona_inicio, zona_fin, count in pairs:
+            zi = (zona_inicio or '').upper().strip()
+            zf = (zona_fin or '').upper().strip()
             
             if zi:
-                zone_starts[zi] += 1
+                zone_starts[zi] += count
             if zf:
-                zone_ends[zf] += 1
+                zone_ends[zf] += count
             if zi and zf:
-                transitions[(zi, zf)] += 1
+                transitions[(zi, zf)] += count
         
         data = {
             'zone_starts': dict(zone_starts),
@@ -664,23 +771,35 @@ class StatsService:
         except (IndexError, ValueError):
             return 0.0
 
-    def _calc_net_minutes(self, match_id: int, team_name: str) -> float:
-        """
-        Calcula los minutos netos de juego del equipo en el partido.
-        Suma (fin - tiempo_as_seconds) para todas las posesiones del equipo.
+    def _penalties_conceded_by_match(self, match_ids: List[int]) -> Dict[tuple, int]:
+        """Penales concedidos (jugada=penales_concedidos) por (match_id, EQUIPO en mayúsculas) en una sola consulta."""
+        if not match_ids:
+            return {}
+        rows = (
+            Play.objects.filter(match_id__in=match_ids)
+            .filter(jugada__icontains='PENALES_CONCEDIDOS')
+            .exclude(equipo='')
+            .values('match_id', equipo_upper=Upper('equipo'))
+            .annotate(count=Count('id'))
+        )
+        return {(row['match_id'], row['equipo_upper']): row['count'] for row in rows}
+
+    def _net_minutes_by_match(self, match_ids: List[int]) -> Dict[tuple, float]:
+        """Minutos netos por (match_id, EQUIPO en mayúsculas).
+
+        Suma (fin - tiempo_as_seconds) para todas las posesiones de cada equipo en el partido.
         """
+        if not match_ids:
+            return {}
         possessions = Play.objects.filter(
-            match_id=match_id,
+            match_id__in=match_ids,
             jugada='POSESION',
-            equipo__iexact=team_name,
-        ).exclude(tiempo='').values_list('fin', 'tiempo')
+        ).exclude(tiempo='').values_list('match_id', 'equipo', 'fin', 'tiempo')
 
-        total_seconds = 0.0
-        for fin, tiempo in possessions:
-            tiempo_secs = self._tiempo_to_seconds(tiempo)
-            total_seconds += float(fin) - tiempo_secs
-
-        return round(total_seconds / 60, 2)
+        seconds = defaultdict(float)
+        for match_id, equipo, fin, tiempo in possessions:
+            seconds[(match_id, equipo.upper())] += float(fin) - self._tiempo_to_seconds(tiempo)
+        return {key: round(total / 60, 2) for key, total in seconds.items()}
 
     def _sum_net_seconds(self, plays_qs) -> float:
         """Suma (fin - tiempo_as_seconds) para un queryset de jugadas."""
@@ -704,26 +823,33 @@ class StatsService:
         if cached is not None:
             return cached
 
-        matches = self._get_base_matches_queryset().order_by('match_date', 'created_at')
-        
-        # Tomar los últimos N
-        match_list = list(matches)[-last_n_matches:]
+        # Los últimos N con ORDER BY ... DESC LIMIT N en la base; se invierten
+        # en Python para devolverlos en orden cronológico.
+        matches = self._get_base_matches_queryset().order_by('-match_date', '-created_at')
+        match_list = list(matches[:last_n_matches])[::-1]
         
+        # Marcadores, penales y minutos netos de los N partidos en tres consultas
+        match_ids = [match.id for match in match_list]
+        scores = self._scores_by_match(match_ids)
+        penalties = self._penalties_conceded_by_match(match_ids)
+        net_minutes_map = self._net_minutes_by_match(match_ids)
+
         result = []
         
         for i, match in enumerate(match_list):
             result_data = self._get_match_result(
                 match.id,
                 match.home_team,
-                match.away_team
+                match.away_team,
+                score=scores.get(match.id, (None, None)),
             )
             
             opp_name = match.away_team if result_data['is_home'] else match.home_team
             team_name = match.home_team if result_data['is_home'] else match.away_team
 
-            team_pen_conc = self._count_penalties_conceded(match.id, team_name)
-            opp_pen_conc = self._count_penalties_conceded(match.id, opp_name)
-            net_minutes = self._calc_net_minutes(match.id, team_name)
+            team_pen_conc = penalties.get((match.id, (team_name or '').strip().upper()), 0)
+            opp_pen_conc = penalties.get((match.id, (opp_name or '').strip().upper()), 0)
+            net_minutes = net_minutes_map.get((match.id, (team_name or '').upper()), 0.0)
             
             result.append({
                 'index': i + 1,
@@ -738,17 +864,37 @@ class StatsService:
         self._cache_set(cache_key, result, STATS_CACHE_TTL)
         return result
 
-    def get_match_detailed_stats(self, match_id: int) -> Dict[str, Any]:
+    def _match_versions(self, match_ids: List[int]) -> Dict[int, str]:
+        """Versión de las jugadas de cada partido ("max_id:cantidad") en una sola consulta.
+
+        Cambia al recargar o borrar jugadas (el COPY asigna ids nuevos), así que sirve
+        para invalidar las estadísticas cacheadas del partido sin señales.
+        """
+        if not match_ids:
+            return {}
+        rows = (
+            Play.objects.filter(match_id__in=match_ids)
+            .values('match_id').annotate(last_id=Max('id'), count=Count('id')).order_by()
+        )
+        versions = {mid: '0:0' for mid in match_ids}
+        for row in rows:
+            versions[row['match_id']] = f"{row['last_id']}:{row['count']}"
+        return versions
+
+    def get_match_detailed_stats(self, match_id: int, version: Optional[str] = None) -> Dict[str, Any]:
         """
         Obtiene estadísticas detalladas de un partido específico.
         
         Args:
             match_id: ID del partido
+            version: Versión de sus jugadas (`_match_versions`); se consulta si no se pasa
             
         Returns:
             Dict completo con todas las métricas del partido
         """
-        cache_key = self._make_cache_key('match_stats', {'match_id': match_id})
+        if version is None:
+            version = self._match_versions([match_id])[match_id]
+        cache_key = self._make_cache_key('match_stats', {'match_id': match_id, 'v': version})
         cached = self._cache_get(cache_key)
         if cached is not None:
             return cached
@@ -759,10 +905,6 @@ class StatsService:
             return {}
         
         plays = Play.objects.filter(match=match)
-        total_plays = plays.count()
-
-        # Tiempos netos (fin - tiempo) sumados sobre posesiones únicamente
-        net_minutes_match = round(self._sum_net_seconds(plays.filter(jugada__iexact='POSESION')) / 60, 2)
 
         # Obtener resultado del partido usando marcador_final
         result_data = self._get_match_result(
@@ -776,36 +918,92 @@ class StatsService:
         opp_name = match.away_team if is_home else match.home_team
         
         # Jugadas solo del equipo analizado
-        team_plays = plays.filter(equipo__iexact=team_name)
-        opp_plays = plays.filter(equipo__iexact=opp_name)
-
-        net_minutes_team = round(self._sum_net_seconds(team_plays.filter(jugada__iexact='POSESION')) / 60, 2)
-        net_minutes_opp = round(self._sum_net_seconds(opp_plays.filter(jugada__iexact='POSESION')) / 60, 2)
+        team_q = Q(equipo__iexact=team_name)
+        opp_q = Q(equipo__iexact=opp_name)
+        team_plays = plays.filter(team_q)
+
+        # Tiempos netos (fin - tiempo) sumados sobre posesiones únicamente: partido,
+        # equipo y rival salen de un único recorrido de las posesiones.
+        team_upper = (team_name or '').upper()
+        opp_upper = (opp_name or '').upper()
+        net_seconds = {'match': 0.0, 'team': 0.0, 'opp': 0.0}
+        possession_times = plays.filter(jugada__iexact='POSESION').exclude(tiempo='').values_list('equipo', 'fin', 'tiempo')
+        for equipo, fin, tiempo in possession_times:
+            seconds = float(fin) - self._tiempo_to_seconds(tiempo)
+            net_seconds['match'] += seconds
+            equipo_upper = equipo.upper()
+            if equipo_upper == team_upper:
+                net_seconds['team'] += seconds
+            elif equipo_upper == opp_upper:
+                net_seconds['opp'] += seconds
+        net_minutes_match = round(net_seconds['match'] / 60, 2)
+        net_minutes_team = round(net_seconds['team'] / 60, 2)
+        net_minutes_opp = round(net_seconds['opp'] / 60, 2)
 
         # Set pieces: lines y scrums del equipo analizado.
         # El total mostrado en el dashboard debe coincidir con las barras visibles:
         # ganados, gana sucio, perdidos y recuperados; no debe sumar set pieces del rival
         # que no forman parte de esas barras.
-        line_filter = Q(jugada__iexact='LINE') | Q(jugada__iexact='LINES') | Q(jugada__icontains='LINE')
-        scrum_filter = Q(jugada__iexact='SCRUMS') | Q(jugada__icontains='SCRUM')
-        win_clean_filter = Q(resultado__iexact='GANA')
-        win_dirty_filter = Q(resultado__iexact='GANA SUCIO') | Q(resultado__icontains='GANA SUCIO')
-        win_any_filter = win_clean_filter | win_dirty_filter | Q(resultado__icontains='GANA')
-        lose_filter = Q(resultado__iexact='PIERDE') | Q(resultado__icontains='PIERDE')
-
-        team_lines_won_clean = team_plays.filter(line_filter & win_clean_filter).count()
-        team_lines_won_dirty = team_plays.filter(line_filter & win_dirty_filter).count()
-        team_lines_lost = team_plays.filter(line_filter & lose_filter).count()
-        opp_lines_lost = opp_plays.filter(line_filter & lose_filter).count()  # lines recuperados
+        def team_count(condition=None):
+            return Count('id', filter=team_q & condition if condition is not None else team_q)
+
+        def opp_count(condition):
+            return Count('id', filter=opp_q & condition)
+
+        # Todos los conteos del partido en una sola consulta (COUNT ... FILTER) sobre sus jugadas
+        totals = plays.aggregate(
+            total_plays=Count('id'),
+            team_plays=team_count(),
+            # Set pieces
+            team_lines_won_clean=team_count(LINE_FILTER & WIN_CLEAN_FILTER),
+            team_lines_won_dirty=team_count(LINE_FILTER & WIN_DIRTY_FILTER),
+            team_lines_lost=team_count(LINE_FILTER & LOSE_FILTER),
+            opp_lines_lost=opp_count(LINE_FILTER & LOSE_FILTER),  # lines recuperados
+            team_scrums_won_clean=team_count(SCRUM_FILTER & WIN_CLEAN_FILTER),
+            team_scrums_won_dirty=team_count(SCRUM_FILTER & WIN_DIRTY_FILTER),
+            team_scrums_lost=team_count(SCRUM_FILTER & LOSE_FILTER),
+            opp_scrums_recovered=opp_count(SCRUM_FILTER & LOSE_FILTER),
+            # Tries, sanciones, goles y tarjetas
+            team_tries=team_count(TRIES_FILTER),
+            tries_converted=team_count(TRIES_FILTER & Q(resultado__iexact='7')),
+            tries_unconverted=team_count(TRIES_FILTER & Q(resultado__iexact='5')),
+            team_penalties=team_count(Q(sancion__icontains='PENAL') | Q(resultado__icontains='PENAL')),
+            penales_goal_success=team_count(Q(jugada__iexact='GOALS') & Q(resultado__iexact='3')),
+            penales_goal_missed=team_count(Q(jugada__iexact='GOAL_ERRADOS')),
+            yellow_cards=team_count(Q(jugada__iexact='TARJETAS') & Q(evento__icontains='AMARILLA')),
+            red_cards=team_count(Q(jugada__iexact='TARJETAS') & Q(evento__icontains='ROJA')),
+            # Posesiones, penales concedidos y pelotas recuperadas
+            total_possessions_equipo=team_count(POSSESSION_FILTER),
+            opp_possessions_total=opp_count(POSSESSION_FILTER),
+            penales_contra=team_count(PENALES_CONCEDIDOS_FILTER),
+            penales_favor=opp_count(PENALES_CONCEDIDOS_FILTER),
+            balls_recovered=opp_count(POSSESSION_FILTER & Q(termina__iexact='PELOTA_PERDIDA')),
+            # Salidas
+            salidas_perdidas=opp_count(SALIDAS_FILTER & (Q(termina__iexact='RECUPERA') | Q(termina__iexact='RECUPERADA'))),
+            salidas_totales_opp=opp_count(SALIDAS_FILTER),
+            salidas_opp_pierde=opp_count(SALIDAS_FILTER & Q(resultado__iexact='PIERDE')),
+            salidas_totales_team=team_count(SALIDAS_FILTER),
+            salidas_team_gana=team_count(SALIDAS_FILTER & Q(resultado__iexact='GANA')),
+            # Rucks
+            rucks_won=team_count(Q(jugada__icontains='RUCKS_GANADOS')),
+            rucks_lost=team_count(Q(jugada__icontains='RUCKS_PERDIDO')),
+        )
+        total_plays = totals['total_plays']
+
+        team_lines_won_clean = totals['team_lines_won_clean']
+        team_lines_won_dirty = totals['team_lines_won_dirty']
+        team_lines_lost = totals['team_lines_lost']
+        opp_lines_lost = totals['opp_lines_lost']
         total_lines_match = team_lines_won_clean + team_lines_won_dirty + team_lines_lost + opp_lines_lost
-        team_scrums_won_clean = team_plays.filter(scrum_filter & win_clean_filter).count()
-        team_scrums_won_dirty = team_plays.filter(scrum_filter & win_dirty_filter).count()
-        team_scrums_lost = team_plays.filter(scrum_filter & lose_filter).count()
+        team_scrums_won_clean = totals['team_scrums_won_clean']
+        team_scrums_won_dirty = totals['team_scrums_won_dirty']
+        team_scrums_lost = totals['team_scrums_lost']
         team_scrums_won_any = team_scrums_won_clean + team_scrums_won_dirty
-        opp_scrums_recovered = opp_plays.filter(scrum_filter & lose_filter).count()
+        opp_scrums_recovered = totals['opp_scrums_recovered']
         total_scrums_match = team_scrums_won_clean + team_scrums_won_dirty + team_scrums_lost + opp_scrums_recovered
 
-        # Desglose por 'sigue_con' para lines y scrums del equipo
+        # Desglose por 'sigue_con' para lines y scrums del equipo.
+        # Recibe filas (resultado, sigue_con, count) ya agrupadas en la base.
         def build_breakdown(play_values_qs, normalize_outcome):
             counts = defaultdict(int)
             labels_set = set()
@@ -823,7 +1021,7 @@ class StatsService:
                 else:
                     follow = follow_raw
                 labels_set.add(follow)
-                counts[(outcome, follow)] += 1
+                counts[(outcome, follow)] += row['count']
             labels = sorted(labels_set)
             outcomes = ['Gana', 'Gana sucio', 'Pierde']
             matrix = []
@@ -856,31 +1054,22 @@ class StatsService:
                 return 'Pierde'
             return None
 
-        line_values = team_plays.filter(line_filter).values('resultado', 'sigue_con')
-        scrum_values = team_plays.filter(scrum_filter).values('resultado', 'sigue_con')
+        line_values = team_plays.filter(LINE_FILTER).values('resultado', 'sigue_con').annotate(count=Count('id')).order_by()
+        scrum_values = team_plays.filter(SCRUM_FILTER).values('resultado', 'sigue_con').annotate(count=Count('id')).order_by()
 
         line_breakdown = build_breakdown(line_values, lambda r: normalize_line_outcome(r.upper()))
         scrum_breakdown = build_breakdown(scrum_values, lambda r: normalize_scrum_outcome(r.upper()))
 
-        # Tries (para estadísticas adicionales)
-        tries_filter = Q(jugada__iexact='TRIES') | Q(jugada__icontains='TRY')
-        team_tries = team_plays.filter(tries_filter).count()
-        tries_converted = team_plays.filter(tries_filter & Q(resultado__iexact='7')).count()
-        tries_unconverted = team_plays.filter(tries_filter & Q(resultado__iexact='5')).count()
-        
-        # Sanciones
-        team_penalties = team_plays.filter(
-            Q(sancion__icontains='PENAL') | Q(resultado__icontains='PENAL')
-        ).count()
-
-        # Penales a los palos (goals)
-        penales_goal_success = team_plays.filter(Q(jugada__iexact='GOALS') & Q(resultado__iexact='3')).count()
-        penales_goal_missed = team_plays.filter(Q(jugada__iexact='GOAL_ERRADOS')).count()
+        # Tries, sanciones, penales a los palos (goals) y tarjetas
+        team_tries = totals['team_tries']
+        tries_converted = totals['tries_converted']
+        tries_unconverted = totals['tries_unconverted']
+        team_penalties = totals['team_penalties']
+        penales_goal_success = totals['penales_goal_success']
+        penales_goal_missed = totals['penales_goal_missed']
         penales_goal_total = penales_goal_success + penales_goal_missed
-
-        # Tarjetas
-        yellow_cards = team_plays.filter(Q(jugada__iexact='TARJETAS') & Q(evento__icontains='AMARILLA')).count()
-        red_cards = team_plays.filter(Q(jugada__iexact='TARJETAS') & Q(evento__icontains='ROJA')).count()
+        yellow_cards = totals['yellow_cards']
+        red_cards = totals['red_cards']
         
         # Distribución por zona
         team_by_zone = team_plays.exclude(zona_inicio='').values('zona_inicio').annotate(
@@ -888,9 +1077,21 @@ class StatsService:
         )
 
         # Pelotas perdidas por zona de fin
-        raw_lost_by_zone = list(team_plays.filter(
-            Q(jugada__iexact='POSESION') & Q(termina__iexact='PELOTA_PERDIDA')
-        ).exclude(zona_fin='').values('zona_fin').annotate(count=Count('id')))
+        # Posesiones del equipo agrupadas por (termina, zona_fin) en una sola consulta:
+        # de ahí salen las pelotas perdidas por zona y el conteo por 'termina'.
+        possession_groups = list(
+            team_plays.filter(POSSESSION_FILTER)
+            .values('termina', 'zona_fin').annotate(count=Count('id')).order_by()
+        )
+        lost_by_zone_counts = defaultdict(int)
+        possession_by_termina = defaultdict(int)
+        for row in possession_groups:
+            possession_by_termina[row['termina']] += row['count']
+            if (row['termina'] or '').upper() == 'PELOTA_PERDIDA' and row['zona_fin']:
+                lost_by_zone_counts[row['zona_fin']] += row['count']
+        raw_lost_by_zone = [
+            {'zona_fin': zona_fin, 'count': count} for zona_fin, count in lost_by_zone_counts.items()
+        ]
 
         def normalize_zone_key(z: str) -> str:
             u = (z or '').strip().upper()
@@ -934,13 +1135,11 @@ class StatsService:
             count=Count('id')
         ).order_by('-count')[:8]
 
-        # Posesiones por resultado de 'termina'
-        possession_raw = team_plays.filter(jugada__iexact='POSESION').values('termina').annotate(count=Count('id'))
         # Total real de posesiones del equipo (denominador correcto para el % de pelotas perdidas)
-        total_possessions_equipo = team_plays.filter(jugada__iexact='POSESION').count()
-        opp_possessions_total = opp_plays.filter(jugada__iexact='POSESION').count()
-        penales_contra = team_plays.filter(jugada__iexact='PENALES_CONCEDIDOS').count()
-        penales_favor = opp_plays.filter(jugada__iexact='PENALES_CONCEDIDOS').count()
+        total_possessions_equipo = totals['total_possessions_equipo']
+        opp_possessions_total = totals['opp_possessions_total']
+        penales_contra = totals['penales_contra']
+        penales_favor = totals['penales_favor']
         possession_buckets = {
             'ventaja': {'label': 'Ventaja', 'count': 0},
             'puntos': {'label': 'Puntos', 'count': 0},
@@ -950,9 +1149,10 @@ class StatsService:
             'kick_touch': {'label': 'Kick al touch', 'count': 0},
             'kick _play': {'label': 'Kick play', 'count': 0},  # variante con espacio
         }
+        # Posesiones por resultado de 'termina' (un valor distinto por vuelta, ya sumado en la base)
         total_possessions = 0
-        for row in possession_raw:
-            raw_key = (row['termina'] or '').strip().lower()
+        for termina, count in possession_by_termina.items():
+            raw_key = (termina or '').strip().lower()
             key = raw_key.replace(' ', '_')
             # Aceptar tanto la versión normalizada como la literal
             if key in possession_buckets:
@@ -961,77 +1161,76 @@ class StatsService:
                 bucket_key = raw_key
             else:
                 continue
-            possession_buckets[bucket_key]['count'] += row['count']
-            total_possessions += row['count']
+            possession_buckets[bucket_key]['count'] += count
+            total_possessions += count
         # Sobrescribir penales usando jugada=penales_concedidos
         possession_buckets['penal/fk_ec']['count'] = penales_contra
         possession_buckets['penal/fk_af']['count'] = penales_favor
         # Pelotas recuperadas: posesiones del rival que terminan en pelota_perdida
-        balls_recovered = opp_plays.filter(
-            Q(jugada__iexact='POSESION') & Q(termina__iexact='PELOTA_PERDIDA')
-        ).count()
+        balls_recovered = totals['balls_recovered']
 
-        # Salidas recuperadas/perdidas
-        salidas_recuperadas = team_plays.filter(
-            Q(jugada__iexact='SALIDAS') & (Q(resultado__iexact='RECUPERADA') | Q(resultado__iexact='RECUPERA'))
-        ).count()
-        salidas_perdidas = opp_plays.filter(
-            Q(jugada__iexact='SALIDAS') & (Q(termina__iexact='RECUPERA') | Q(termina__iexact='RECUPERADA'))
-        ).count()
-        salidas_totales_opp = opp_plays.filter(Q(jugada__iexact='SALIDAS')).count()
+        # Salidas perdidas: salidas del rival que terminan recuperadas
+        salidas_perdidas = totals['salidas_perdidas']
+        salidas_totales_opp = totals['salidas_totales_opp']
         # Confirmación de puntos: salidas del rival que terminaron en PIERDE (nosotros confirmamos bien)
-        salidas_opp_pierde = opp_plays.filter(
-            Q(jugada__iexact='SALIDAS') & Q(resultado__iexact='PIERDE')
-        ).count()
+        salidas_opp_pierde = totals['salidas_opp_pierde']
         # Salidas recuperadas: salidas del equipo en análisis con resultado=GANA
-        salidas_totales_team = team_plays.filter(Q(jugada__iexact='SALIDAS')).count()
-        salidas_team_gana = team_plays.filter(
-            Q(jugada__iexact='SALIDAS') & Q(resultado__iexact='GANA')
-        ).count()
+        salidas_totales_team = totals['salidas_totales_team']
+        salidas_team_gana = totals['salidas_team_gana']
+
+        # Detalle de penales concedidos: una consulta agrupada por las tres columnas
+        penales_zone_counts = Counter()
+        penales_situacion_counts = Counter()
+        penales_tipo_counts = Counter()
+        penales_groups = (
+            team_plays.filter(PENALES_CONCEDIDOS_FILTER)
+            .values('zona_inicio', 'situacion_penal', 'tipo').annotate(count=Count('id')).order_by()
+        )
+        for row in penales_groups:
+            if row['zona_inicio']:
+                penales_zone_counts[row['zona_inicio']] += row['count']
+            if row['situacion_penal']:
+                penales_situacion_counts[row['situacion_penal']] += row['count']
+            if row['tipo']:
+                penales_tipo_counts[row['tipo']] += row['count']
+        penales_by_zone = [{'zona_inicio': k, 'count': v} for k, v in penales_zone_counts.most_common()]
+        penales_by_situacion = [{'situacion_penal': k, 'count': v} for k, v in penales_situacion_counts.most_common()]
+        penales_by_tipo = [{'tipo': k, 'count': v} for k, v in penales_tipo_counts.most_common()]
 
         pelota_perdida_count = possession_buckets.get('pelota_perdida', {}).get('count', 0)
         total_non_lost_possessions = max(total_possessions - pelota_perdida_count, 0)
 
         # Rucks ganados/perdidos del equipo analizado
-        rucks_won = team_plays.filter(Q(jugada__iexact='RUCKS_GANADOS') | Q(jugada__icontains='RUCKS_GANADOS')).count()
-        rucks_lost = team_plays.filter(Q(jugada__iexact='RUCKS_PERDIDO') | Q(jugada__icontains='RUCKS_PERDIDO')).count()
-        opp_rucks_won = opp_plays.filter(Q(jugada__iexact='RUCKS_GANADOS') | Q(jugada__icontains='RUCKS_GANADOS')).count()
-        opp_rucks_lost = opp_plays.filter(Q(jugada__iexact='RUCKS_PERDIDO') | Q(jugada__icontains='RUCKS_PERDIDO')).count()
+        rucks_won = totals['rucks_won']
+        rucks_lost = totals['rucks_lost']
 
         # Armar lista de items incluyendo recuperadas; porcentajes sobre total general
         total_general = (
             total_possessions + balls_recovered + rucks_won + rucks_lost +
             salidas_team_gana + salidas_perdidas + penales_contra + penales_favor
         )
-        ordered_keys = [
-            'penal/fk_ec', 'penal/fk_af',
-            'pelota_perdida', 'pelotas_recuperadas',
-            'salidas_recuperadas', 'salidas_perdidas',
-            'rucks_ganados', 'rucks_perdidos'
+        # (etiqueta, conteo) por ítem, en el orden en que se muestran
+        item_sources = {
+            'penal/fk_ec': (possession_buckets['penal/fk_ec']['label'], possession_buckets['penal/fk_ec']['count']),
+            'penal/fk_af': (possession_buckets['penal/fk_af']['label'], possession_buckets['penal/fk_af']['count']),
+            'pelota_perdida': (possession_buckets['pelota_perdida']['label'], possession_buckets['pelota_perdida']['count']),
+            'pelotas_recuperadas': ('Pelotas recuperadas', balls_recovered),
+            'salidas_recuperadas': ('Salidas recuperadas', salidas_team_gana),
+            'salidas_perdidas': ('Salidas perdidas', salidas_perdidas),
+            'rucks_ganados': ('Rucks ganados', rucks_won),
+            'rucks_perdidos': ('Rucks perdidos', rucks_lost),
+        }
+        # Todos los ítems comparten denominador: un solo cociente para los ocho porcentajes
+        pct_factor = 100 / total_general if total_general > 0 else 0
+        possession_items = [
+            {
+                'key': key,
+                'label': label,
+                'count': count,
+                'pct': round(count * pct_factor, 1) if pct_factor else 0,
+            }
+            for key, (label, count) in item_sources.items()
         ]
-        possession_items = []
-        for key in ordered_keys:
-            if key == 'pelotas_recuperadas':
-                count = balls_recovered
-                label = 'Pelotas recuperadas'
-            elif key == 'salidas_recuperadas':
-                count = salidas_team_gana
-                label = 'Salidas recuperadas'
-            elif key == 'salidas_perdidas':
-                count = salidas_perdidas
-                label = 'Salidas perdidas'
-            elif key == 'rucks_ganados':
-                count = rucks_won
-                label = 'Rucks ganados'
-            elif key == 'rucks_perdidos':
-                count = rucks_lost
-                label = 'Rucks perdidos'
-            else:
-                data = possession_buckets.get(key, {'label': key, 'count': 0})
-                count = data['count']
-                label = data.get('label', key)
-            pct = round((count / total_general * 100), 1) if total_general > 0 else 0
-            possession_items.append({'key': key, 'label': label, 'count': count, 'pct': pct})
         possession_summary = {
             'total': total_possessions,
             'opp_total': opp_possessions_total,
@@ -1100,7 +1299,7 @@ class StatsService:
             'team_score': result_data['team_score'],
             'opp_score': result_data['opp_score'],
             'team_stats': {
-                'plays': team_plays.count(),
+                'plays': totals['team_plays'],
                 'tries': team_tries,
                 'tries_converted': tries_converted,
                 'tries_unconverted': tries_unconverted,
@@ -1115,24 +1314,9 @@ class StatsService:
                 'balls_recovered': balls_recovered,
             },
             'penales_detail': {
-                'by_zone': list(
-                    team_plays.filter(jugada__iexact='PENALES_CONCEDIDOS')
-                    .exclude(zona_inicio='')
-                    .values('zona_inicio').annotate(count=Count('id'))
-                    .order_by('-count')
-                ),
-                'by_situacion': list(
-                    team_plays.filter(jugada__iexact='PENALES_CONCEDIDOS')
-                    .exclude(situacion_penal='')
-                    .values('situacion_penal').annotate(count=Count('id'))
-                    .order_by('-count')
-                ),
-                'by_tipo': list(
-                    team_plays.filter(jugada__iexact='PENALES_CONCEDIDOS')
-                    .exclude(tipo='')
-                    .values('tipo').annotate(count=Count('id'))
-                    .order_by('-count')
-                ),
+                'by_zone': penales_by_zone,
+                'by_situacion': penales_by_situacion,
+                'by_tipo': penales_by_tipo,
             },
             'possession': possession_summary,
             'set_pieces': {
@@ -1228,52 +1412,38 @@ class StatsService:
                     draws += 1
 
         # ── Tries ───────────────────────────────────────────────────
-        tries_filter = Q(jugada__iexact='TRIES') | Q(jugada__icontains='TRY')
-        tries_for = team_plays.filter(tries_filter).count()
+        tries_for = team_plays.filter(TRIES_FILTER).count()
 
         # ── Lines ───────────────────────────────────────────────────
-        line_filter = (
-            Q(jugada__iexact='LINE') | Q(jugada__iexact='LINES') | Q(jugada__icontains='LINE')
-        )
-        win_clean_filter = Q(resultado__iexact='GANA')
-        win_dirty_filter = (
-            Q(resultado__iexact='GANA SUCIO') |
-            Q(resultado__icontains='GANA SUCIO')
-        )
-        win_any_filter = win_clean_filter | win_dirty_filter
-        lose_filter = Q(resultado__iexact='PIERDE') | Q(resultado__icontains='PIERDE')
-
-        lines_won_clean = team_plays.filter(line_filter & win_clean_filter).count()
-        lines_won_dirty = team_plays.filter(line_filter & win_dirty_filter).count()
+        lines_won_clean = team_plays.filter(LINE_FILTER & WIN_CLEAN_FILTER).count()
+        lines_won_dirty = team_plays.filter(LINE_FILTER & WIN_DIRTY_FILTER).count()
         lines_won = lines_won_clean + lines_won_dirty
-        lines_lost = team_plays.filter(line_filter & lose_filter).count()
+        lines_lost = team_plays.filter(LINE_FILTER & LOSE_FILTER).count()
         lines_total = lines_won + lines_lost
 
         # ── Scrums ──────────────────────────────────────────────────
-        scrum_filter = Q(jugada__iexact='SCRUMS') | Q(jugada__icontains='SCRUM')
-        scrums_won_clean = team_plays.filter(scrum_filter & win_clean_filter).count()
-        scrums_won_dirty = team_plays.filter(scrum_filter & win_dirty_filter).count()
+        scrums_won_clean = team_plays.filter(SCRUM_FILTER & WIN_CLEAN_FILTER).count()
+        scrums_won_dirty = team_plays.filter(SCRUM_FILTER & WIN_DIRTY_FILTER).count()
         scrums_won = scrums_won_clean + scrums_won_dirty
-        scrums_lost = team_plays.filter(scrum_filter & lose_filter).count()
+        scrums_lost = team_plays.filter(SCRUM_FILTER & LOSE_FILTER).count()
         scrums_total = scrums_won + scrums_lost
 
         # ── Penales concedidos ───────────────────────────────────────
-        pen_filter = Q(jugada__iexact='PENALES_CONCEDIDOS')
-        penales_total = team_plays.filter(pen_filter).count()
+        penales_total = team_plays.filter(PENALES_CONCEDIDOS_FILTER).count()
         penales_by_zone = list(
-            team_plays.filter(pen_filter)
+            team_plays.filter(PENALES_CONCEDIDOS_FILTER)
             .exclude(zona_inicio='')
             .values('zona_inicio').annotate(count=Count('id'))
             .order_by('-count')
         )
         penales_by_situacion = list(
-            team_plays.filter(pen_filter)
+            team_plays.filter(PENALES_CONCEDIDOS_FILTER)
             .exclude(situacion_penal='')
             .values('situacion_penal').annotate(count=Count('id'))
             .order_by('-count')
         )
         penales_by_tipo = list(
-            team_plays.filter(pen_filter)
+            team_plays.filter(PENALES_CONCEDIDOS_FILTER)
             .exclude(tipo='')
             .values('tipo').annotate(count=Count('id'))
             .order_by('-count')
@@ -1284,7 +1454,7 @@ class StatsService:
         total_possessions = pos_plays.count()
         net_minutes_total = round(self._sum_net_seconds(pos_plays) / 60, 2)
         avg_net_minutes = round(net_minutes_total / total_matches, 2) if total_matches > 0 else 0.0
-        pelota_perdida = team_plays.filter(pen_filter | (Q(jugada__iexact='POSESION') & Q(termina__iexact='PELOTA_PERDIDA'))).filter(
+        pelota_perdida = team_plays.filter(PENALES_CONCEDIDOS_FILTER | (Q(jugada__iexact='POSESION') & Q(termina__iexact='PELOTA_PERDIDA'))).filter(
             Q(jugada__iexact='POSESION') & Q(termina__iexact='PELOTA_PERDIDA')
         ).count()
 
@@ -1300,7 +1470,7 @@ class StatsService:
         # Usar alias del equipo si existe, sino nombre completo en mayúsculas
         _raw_name = team_name.strip().upper() if team_name else ''
         try:
-            _team_obj = Team.objects.filter(name__iexact=_raw_name).only('alias').first()
+            _team_obj = Team.objects.get_cached(_raw_name)
             display_name = (_team_obj.alias.strip().upper() if _team_obj and _team_obj.alias else _raw_name)
         except Exception:
             display_name = _raw_name
@@ -1430,13 +1600,7 @@ class StatsService:
         team_plays = Play.objects.filter(match_id__in=match_ids).filter(plays_q)
 
         # ── Lines ganados (GANA + GANA SUCIO) por set / tiro / sigue_con ───
-        line_filter = Q(jugada__iexact='LINE') | Q(jugada__iexact='LINES') | Q(jugada__icontains='LINE')
-        win_filter = (
-            Q(resultado__iexact='GANA') |
-            Q(resultado__iexact='GANA SUCIO') |
-            Q(resultado__icontains='GANA SUCIO')
-        )
-        won_lines = team_plays.filter(line_filter & win_filter)
+        won_lines = team_plays.filter(LINE_FILTER & WIN_ANY_FILTER)
 
         lines_by_set = list(
             won_lines.exclude(set='').values('set').annotate(count=Count('id')).order_by('-count')
@@ -1495,14 +1659,19 @@ class StatsService:
         Returns:
             Dict con estadísticas comparativas
         """
-        key = self._make_cache_key('compare', {'match_ids': ','.join(str(m) for m in sorted(match_ids))})
+        # Versiones de todos los partidos en una consulta: la clave cambia si se recargan jugadas
+        versions = self._match_versions(match_ids)
+        key = self._make_cache_key('compare', {
+            'match_ids': ','.join(str(m) for m in sorted(match_ids)),
+            'versions': ','.join(versions[m] for m in sorted(match_ids)),
+        })
         cached = self._cache_get(key)
         if cached is not None:
             return cached
 
         comparison = []
         for mid in match_ids:
-            stats = self.get_match_detailed_stats(mid)
+            stats = self.get_match_detailed_stats(mid, version=versions[mid])
             if stats:
                 comparison.append(stats)
         data = {
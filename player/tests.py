@@ -1,7 +1,13 @@
+from decimal import Decimal
+from io import StringIO
+
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db.models import Avg, Sum
 from django.test import TestCase
 
-from player.models import Match, Play
+from player.models import Match, Play, Profile
 from player.services.stats_service import StatsService
 
 
@@ -44,3 +50,128 @@ class MatchStatsSetPiecesTotalsTests(TestCase):
 
         self.assertEqual(set_pieces['line_total_match'], 4)
         self.assertEqual(set_pieces['scrum_total_match'], 4)
+
+
+class StatsServiceMemoTests(TestCase):
+    def test_score_and_tries_are_queried_once_per_instance(self):
+        user = User.objects.create_user(username='coach', password='secret')
+        match = Match.objects.create(home_team='OURS', away_team='THEM', video_id='video-memo-1')
+        Play.objects.create(match=match, inicio=0, fin=1, equipo='OURS', jugada='TRIES', marcador_final='5 - 0')
+
+        service = StatsService(user, team_name='OURS')
+        with self.assertNumQueries(2):
+            self.assertEqual(service._parse_marcador_final(match.id), (5, 0))
+            self.assertEqual(service._count_tries(match.id, 'OURS'), 1)
+            # Segunda vuelta: sale del memo de la instancia, sin consultas.
+            self.assertEqual(service._parse_marcador_final(match.id), (5, 0))
+            self.assertEqual(service._count_tries(match.id, 'ours'), 1)
+
+
+class MatchBulkCreateNormalizedTests(TestCase):
+    def test_team_names_are_normalized_like_save(self):
+        Match.objects.bulk_create_normalized([
+            Match(home_team='  ours ', away_team='Them', video_id='video-bulk-match-1'),
+            Match(home_team='RIVAL', away_team='ours', video_id='video-bulk-match-2'),
+        ])
+
+        self.assertEqual(
+            list(Match.objects.order_by('video_id').values_list('home_team', 'away_team')),
+            [('OURS', 'THEM'), ('RIVAL', 'OURS')],
+        )
+
+
+class MillisecondsFieldTests(TestCase):
+    def setUp(self):
+        self.match = Match.objects.create(home_team='OURS', away_team='THEM', video_id='video-ms-1')
+
+    def test_round_trip_keeps_seconds_with_milliseconds(self):
+        play = Play.objects.create(match=self.match, inicio=Decimal('12.345'), fin=Decimal('13.5'))
+        play.refresh_from_db()
+        self.assertEqual(play.inicio, Decimal('12.345'))
+        self.assertEqual(play.fin, Decimal('13.500'))
+
+    def test_filters_and_values_work_in_seconds(self):
+        Play.objects.create(match=self.match, inicio=Decimal('12.4'), fin=Decimal('13'))
+        Play.objects.create(match=self.match, inicio=Decimal('12.5'), fin=Decimal('14'))
+
+        # '12.5' se compara contra 12500 ms en la base.
+        self.assertEqual(
+            list(Play.objects.filter(inicio__gte='12.5').values_list('inicio', 'fin')),
+            [(Decimal('12.500'), Decimal('14.000'))],
+        )
+        self.assertEqual(
+            list(Play.objects.order_by('inicio').values('inicio')),
+            [{'inicio': Decimal('12.400')}, {'inicio': Decimal('12.500')}],
+        )
+
+    def test_sum_keeps_seconds_and_avg_returns_raw_milliseconds(self):
+        Play.objects.create(match=self.match, inicio=Decimal('1.5'), fin=Decimal('2'))
+        Play.objects.create(match=self.match, inicio=Decimal('2.5'), fin=Decimal('3'))
+
+        # Sum conserva MillisecondsField como output_field; Avg resuelve a FloatField.
+        totals = Play.objects.aggregate(total=Sum('inicio'), promedio=Avg('inicio'))
+        self.assertEqual(totals['total'], Decimal('4.000'))
+        self.assertEqual(totals['promedio'], 2000.0)
+
+    def test_validation_limits_are_in_seconds(self):
+        play = Play(match=self.match, inicio=Decimal('999999.999'), fin=Decimal('999999.999'))
+        play.full_clean()
+
+        play.fin = Decimal('1000000')
+        with self.assertRaises(ValidationError):
+            play.full_clean()
+
+
+class PlayBulkLoadTests(TestCase):
+    def test_bulk_load_persists_empty_text_and_fractional_times(self):
+        match = Match.objects.create(home_team='OURS', away_team='THEM', video_id='video-bulk-1')
+        plays = [
+            Play(match=match, inicio=Decimal('0.250'), fin=Decimal('1.5'), jugada='LINE', equipo='OURS', resultado='GANA'),
+            Play(match=match, inicio=Decimal('12.345'), fin=Decimal('15.001'), jugada='', equipo='THEM', jugadores='"9", 10'),
+        ]
+
+        self.assertEqual(Play.objects.bulk_load(plays), 2)
+
+        loaded = list(
+            Play.objects.filter(match=match).order_by('inicio')
+            .values_list('inicio', 'fin', 'jugada', 'equipo', 'resultado', 'jugadores')
+        )
+        self.assertEqual(loaded, [
+            (Decimal('0.250'), Decimal('1.500'), 'LINE', 'OURS', 'GANA', ''),
+            (Decimal('12.345'), Decimal('15.001'), '', 'THEM', '', '"9", 10'),
+        ])
+        self.assertEqual(Play.objects.bulk_load([]), 0)
+
+
+class UserProfileSignalTests(TestCase):
+    def test_saving_existing_user_does_not_resave_profile(self):
+        user = User.objects.create_user(username='coach', password='secret')
+        self.assertTrue(Profile.objects.filter(user=user).exists())
+
+        # Sólo el UPDATE del usuario: el perfil no se vuelve a guardar.
+        with self.assertNumQueries(1):
+            user.save()
+
+
+class ProfileBulkEnsureTests(TestCase):
+    def test_creates_profiles_only_for_users_without_one(self):
+        with_profile = User.objects.create_user(username='coach', password='secret')
+        # bulk_create no dispara post_save: estos usuarios quedan sin perfil.
+        bulk_users = User.objects.bulk_create([User(username='bulk-1'), User(username='bulk-2')])
+
+        created = Profile.objects.bulk_ensure([with_profile, *[u.pk for u in bulk_users]])
+
+        self.assertEqual(created, 2)
+        self.assertEqual(Profile.objects.filter(user=with_profile).count(), 1)
+        self.assertEqual(Profile.objects.filter(user__username__startswith='bulk-').count(), 2)
+        self.assertEqual(Profile.objects.bulk_ensure(bulk_users), 0)
+
+    def test_ensure_profiles_command_reports_created_count(self):
+        User.objects.create_user(username='coach', password='secret')
+        User.objects.bulk_create([User(username='bulk-1'), User(username='bulk-2')])
+
+        out = StringIO()
+        call_command('ensure_profiles', stdout=out)
+
+        self.assertIn('Perfiles creados: 2', out.getvalue())
+        self.assertFalse(User.objects.filter(profile__isnull=True).exists())
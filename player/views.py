@@ -15,7 +15,7 @@ Estructura general del módulo:
 9. Gestión de presets de selección de jugadas para reusar clips (`MatchSelectionPreset*`).
 
 Cada bloque incluye comentarios sobre decisiones de diseño, validaciones y
-performance (uso de `bulk_create`, `Subquery`, `Exists`, índices y filtrado).
+performance (uso de `bulk_create`/COPY, `Subquery`, `Exists`, índices y filtrado).
 """
 import csv
 import io
@@ -32,7 +32,6 @@ from django.contrib import messages
 from django.contrib.auth import logout
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth.views import LoginView, LogoutView
-from django.core.paginator import Paginator
 from django.db import transaction
 from django.db.models import Q, OuterRef, Subquery, Exists, F
 from django.http import HttpResponse, JsonResponse, HttpResponseBadRequest, HttpResponseForbidden
@@ -92,6 +91,7 @@ def make_dict_reader_from_text(text: str) -> csv.DictReader:
 
 # --- Helper: validar orden exacto de columnas ---
 # Encabezados requeridos (orden no importa durante la validación flexible)
+# TORNEO se mantiene por compatibilidad de formato: al importar se ignora (el torneo es `match.tournament`).
 _BASE_REQUIRED_HEADERS_ORDER = [
     'JUGADA','ARBITRO','CANAL DE INICIO','EVENTO','EQUIPO','FIN','FICHA','INICIA','INICIO',
     'MARCADOR FINAL','TERMINA','TIEMPO','TORNEO','ZONA FIN','ZONA INICIO','RESULTADO','JUGADORES',
@@ -189,6 +189,65 @@ def validate_headers_flexible(fieldnames):
         return False, f"Faltan columnas obligatorias en el CSV: {', '.join(missing)}", {}
     return True, '', header_map
 
+# Campo de texto de `Play` -> clave de `header_map` (columna CSV ya validada)
+PLAY_TEXT_COLUMNS = (
+    ('jugada', 'JUGADA'),
+    ('arbitro', 'ARBITRO'),
+    ('canal_de_inicio', 'CANAL DE INICIO'),
+    ('desde', 'DESDE'),
+    ('canal', 'CANAL'),
+    ('fases', 'FASES'),
+    ('opcion', 'OPCION'),
+    ('zona', 'ZONA'),
+    ('evento', 'EVENTO'),
+    ('equipo', 'EQUIPO'),
+    ('ficha', 'FICHA'),
+    ('inicia', 'INICIA'),
+    ('marcador_final', 'MARCADOR FINAL'),
+    ('termina', 'TERMINA'),
+    ('tiempo', 'TIEMPO'),
+    ('zona_fin', 'ZONA FIN'),
+    ('zona_inicio', 'ZONA INICIO'),
+    ('resultado', 'RESULTADO'),
+    ('jugadores', 'JUGADORES'),
+    ('sigue_con', 'SIGUE CON'),
+    ('pos_tiro', 'POS TIRO'),
+    ('set', 'SET'),
+    ('tiro', 'TIRO'),
+    ('tipo', 'TIPO'),
+    ('accion', 'ACCION'),
+    ('termina_en', 'TERMINA EN'),
+    ('sancion', 'SANCION'),
+    ('situacion', 'SITUACION'),
+    ('transicion', 'TRANSICION'),
+    ('situacion_penal', 'SITUACION PENAL'),
+    ('nueva_categoria', 'NUEVA CATEGORIA'),
+    ('acercar', 'ACERCAR'),
+    ('alejar', 'ALEJAR'),
+)
+
+
+def build_plays_from_rows(match, reader, header_map):
+    """Arma las jugadas (sin guardar) de un CSV validado con `validate_headers_flexible`.
+
+    Las columnas presentes se resuelven una sola vez por archivo; los opcionales
+    ausentes quedan en blanco (default del modelo).
+    """
+    text_columns = [(field, header_map[key]) for field, key in PLAY_TEXT_COLUMNS if key in header_map]
+    inicio_col = header_map['INICIO']
+    fin_col = header_map['FIN']
+    plays = []
+    for row in reader:
+        values = {field: (row.get(col) or '').strip() for field, col in text_columns}
+        plays.append(Play(
+            match=match,
+            inicio=parse_time_to_seconds(row.get(inicio_col) or ''),
+            fin=parse_time_to_seconds(row.get(fin_col) or ''),
+            **values,
+        ))
+    return plays
+
+
 # --- Helper: extraer marcador desde campo 'marcador_final' ---
 def _parse_score_from_marcador(marcador: str):
     """Extrae (home_score, away_score) de un string tipo '24 - 17' o '24-17'.
@@ -415,51 +474,10 @@ class AnalysisUploadView(LoginRequiredMixin, UserPassesTestMixin, FormView):
                     if not ok:
                         messages.error(self.request, msg)
                         return self.render_to_response(self.get_context_data(form=form))
-                    plays_to_create = []
-                    count = 0
-                    for row in reader:
-                        plays_to_create.append(Play(
-                            match=match,
-                            jugada=(row.get(header_map['JUGADA']) or '').strip(),
-                            arbitro=(row.get(header_map['ARBITRO']) or '').strip(),
-                            canal_de_inicio=(row.get(header_map['CANAL DE INICIO']) or '').strip(),
-                            desde=(row.get(header_map['DESDE']) or '').strip(),
-                            canal=(row.get(header_map['CANAL']) or '').strip(),
-                            fases=(row.get(header_map['FASES']) or '').strip(),
-                            opcion=(row.get(header_map['OPCION']) or '').strip(),
-                            zona=(row.get(header_map['ZONA']) or '').strip(),
-                            evento=(row.get(header_map['EVENTO']) or '').strip(),
-                            equipo=(row.get(header_map['EQUIPO']) or '').strip(),
-                            fin=parse_time_to_seconds(row.get(header_map['FIN']) or ''),
-                            ficha=(row.get(header_map['FICHA']) or '').strip(),
-                            inicia=(row.get(header_map['INICIA']) or '').strip(),
-                            inicio=parse_time_to_seconds(row.get(header_map['INICIO']) or ''),
-                            marcador_final=(row.get(header_map['MARCADOR FINAL']) or '').strip(),
-                            termina=(row.get(header_map['TERMINA']) or '').strip(),
-                            tiempo=(row.get(header_map['TIEMPO']) or '').strip(),
-                            torneo=(row.get(header_map['TORNEO']) or '').strip(),
-                            zona_fin=(row.get(header_map['ZONA FIN']) or '').strip(),
-                            zona_inicio=(row.get(header_map['ZONA INICIO']) or '').strip(),
-                            resultado=(row.get(header_map['RESULTADO']) or '').strip(),
-                            jugadores=(row.get(header_map['JUGADORES']) or '').strip(),
-                            sigue_con=(row.get(header_map['SIGUE CON']) or '').strip(),
-                            pos_tiro=(row.get(header_map['POS TIRO']) or '').strip(),
-                            set=(row.get(header_map['SET']) or '').strip(),
-                            tiro=(row.get(header_map['TIRO']) or '').strip(),
-                            tipo=(row.get(header_map['TIPO']) or '').strip(),
-                            accion=(row.get(header_map['ACCION']) or '').strip(),
-                            termina_en=(row.get(header_map.get('TERMINA EN','')) or '').strip(),
-                            sancion=(row.get(header_map['SANCION']) or '').strip(),
-                            situacion=(row.get(header_map.get('SITUACION','')) or '').strip(),
-                            transicion=(row.get(header_map['TRANSICION']) or '').strip(),
-                            situacion_penal=(row.get(header_map.get('SITUACION PENAL','')) or '').strip(),
-                            nueva_categoria=(row.get(header_map.get('NUEVA CATEGORIA','')) or '').strip(),
-                            acercar=(row.get(header_map.get('ACERCAR','')) or '').strip(),
-                            alejar=(row.get(header_map.get('ALEJAR','')) or '').strip(),
-                        ))
-                        count += 1
+                    plays_to_create = build_plays_from_rows(match, reader, header_map)
+                    count = len(plays_to_create)
                     if plays_to_create:
-                        Play.objects.bulk_create(plays_to_create, batch_size=1000)
+                        Play.objects.bulk_load(plays_to_create)
                         # Intentar extraer marcador final del último play para guardar el resultado
                         last_marcador = next(
                             (p.marcador_final for p in reversed(plays_to_create) if p.marcador_final),
@@ -590,7 +608,8 @@ class MatchPlayerView(LoginRequiredMixin, DetailView):
             response['Content-Disposition'] = f'attachment; filename="{safe_name}.csv"'
             writer = csv.writer(response)
             writer.writerow(EXPORT_HEADERS_ORDER)
-            for p in plays_list:
+            # iterator(): el export no cachea el queryset completo en memoria
+            for p in plays_list.iterator(chunk_size=2000):
                 writer.writerow([
                     p.jugada, p.arbitro, p.canal_de_inicio, p.evento, p.equipo, p.fin, p.ficha, p.inicia, p.inicio,
                     p.marcador_final, p.termina, p.tiempo, p.torneo, p.zona_fin, p.zona_inicio, p.resultado, p.jugadores,
@@ -605,7 +624,6 @@ class MatchPlayerView(LoginRequiredMixin, DetailView):
         context = super().get_context_data(**kwargs)
         match = self.get_object()
         
-        plays_list = match.plays.select_related('match').all().order_by('inicio')
         context['plays_total'] = match.plays.count()
 
         # Determinar si mostrar acceso a estadísticas y con qué equipo enfocar
@@ -647,30 +665,16 @@ class MatchPlayerView(LoginRequiredMixin, DetailView):
         inicia_filter = self.request.GET.get('inicia', '')
         jugada_values = self.request.GET.getlist('jugada')
 
+        # Los filtros sólo se reflejan en los desplegables: la grilla la carga DataTables vía `plays_data`.
         if evento_filter:
-            plays_list = plays_list.filter(evento=evento_filter)
             filter_params['evento'] = evento_filter
         filter_params['equipo'] = equipo_values
-        if equipo_values:
-            plays_list = plays_list.filter(equipo__in=equipo_values)
         filter_params['zona_inicio'] = zona_inicio_values
-        if zona_inicio_values:
-            plays_list = plays_list.filter(zona_inicio__in=zona_inicio_values)
         filter_params['zona_fin'] = zona_fin_values
-        if zona_fin_values:
-            plays_list = plays_list.filter(zona_fin__in=zona_fin_values)
         if inicia_filter:
-            plays_list = plays_list.filter(inicia=inicia_filter)
             filter_params['inicia'] = inicia_filter
         filter_params['jugada'] = jugada_values
-        if jugada_values:
-            plays_list = plays_list.filter(jugada__in=jugada_values)
         
-        paginator = Paginator(plays_list, 10)
-        page_number = self.request.GET.get('page')
-        page_obj = paginator.get_page(page_number)
-        
-        context['page_obj'] = page_obj
         context['filter_params'] = filter_params
         
         # Opciones únicas normalizadas (sin duplicados por mayúsculas/espacios)
@@ -739,9 +743,7 @@ class MatchListView(LoginRequiredMixin, ListView):
             variants.add(normalized_name)
 
         if team is None and normalized_name:
-            matched_team = Team.objects.filter(
-                Q(name__iexact=team_name) | Q(alias__iexact=team_name)
-            ).only('name', 'alias').first()
+            matched_team = Team.objects.get_cached(team_name)
             if matched_team:
                 variants.update(self._get_team_variants(team=matched_team))
 
@@ -861,7 +863,7 @@ class MatchListView(LoginRequiredMixin, ListView):
         if date_to:
             queryset = queryset.filter(match_date__lte=date_to)
 
-        result_sq = Play.objects.filter(match=OuterRef('pk')).exclude(marcador_final='').values('marcador_final')[:1]
+        result_sq = Play.objects.filter(match=OuterRef('pk')).exclude(marcador_final='').order_by('inicio').values('marcador_final')[:1]
         queryset = queryset.annotate(match_result=Subquery(result_sq))
 
         has_plays_exists = Play.objects.filter(match=OuterRef('pk'))
@@ -958,7 +960,7 @@ class MatchPlaysDataView(LoginRequiredMixin, View):
     # Endpoint JSON para DataTables con filtros, búsqueda, orden y paginación.
     def get(self, request, pk):
         match = get_object_or_404(Match, pk=pk)
-        base_qs = Play.objects.filter(match=match).select_related('match')
+        base_qs = Play.objects.filter(match=match).as_list()  # `play.match` no se usa: sin JOIN
         plays = base_qs
 
         # Aplicar filtros (situacion -> jugada)
@@ -1111,54 +1113,13 @@ class MatchCSVUploadView(LoginRequiredMixin, UserPassesTestMixin, View):
                 messages.error(request, msg)
                 return redirect('player:play_match', pk=pk)
 
-            plays_to_create = []
-            count = 0
-            for row in reader:
-                plays_to_create.append(Play(
-                    match=match,
-                    jugada=(row.get(header_map['JUGADA']) or '').strip(),
-                    arbitro=(row.get(header_map['ARBITRO']) or '').strip(),
-                    canal_de_inicio=(row.get(header_map['CANAL DE INICIO']) or '').strip(),
-                    desde=(row.get(header_map['DESDE']) or '').strip(),
-                    canal=(row.get(header_map['CANAL']) or '').strip(),
-                    fases=(row.get(header_map['FASES']) or '').strip(),
-                    opcion=(row.get(header_map['OPCION']) or '').strip(),
-                    zona=(row.get(header_map['ZONA']) or '').strip(),
-                    evento=(row.get(header_map['EVENTO']) or '').strip(),
-                    equipo=(row.get(header_map['EQUIPO']) or '').strip(),
-                    fin=parse_time_to_seconds(row.get(header_map['FIN']) or ''),
-                    ficha=(row.get(header_map['FICHA']) or '').strip(),
-                    inicia=(row.get(header_map['INICIA']) or '').strip(),
-                    inicio=parse_time_to_seconds(row.get(header_map['INICIO']) or ''),
-                    marcador_final=(row.get(header_map['MARCADOR FINAL']) or '').strip(),
-                    termina=(row.get(header_map['TERMINA']) or '').strip(),
-                    tiempo=(row.get(header_map['TIEMPO']) or '').strip(),
-                    torneo=(row.get(header_map['TORNEO']) or '').strip(),
-                    zona_fin=(row.get(header_map['ZONA FIN']) or '').strip(),
-                    zona_inicio=(row.get(header_map['ZONA INICIO']) or '').strip(),
-                    resultado=(row.get(header_map['RESULTADO']) or '').strip(),
-                    jugadores=(row.get(header_map['JUGADORES']) or '').strip(),
-                    sigue_con=(row.get(header_map['SIGUE CON']) or '').strip(),
-                    pos_tiro=(row.get(header_map['POS TIRO']) or '').strip(),
-                    set=(row.get(header_map['SET']) or '').strip(),
-                    tiro=(row.get(header_map['TIRO']) or '').strip(),
-                    tipo=(row.get(header_map['TIPO']) or '').strip(),
-                    accion=(row.get(header_map['ACCION']) or '').strip(),
-                    termina_en=(row.get(header_map.get('TERMINA EN','')) or '').strip(),
-                    sancion=(row.get(header_map['SANCION']) or '').strip(),
-                    situacion=(row.get(header_map.get('SITUACION','')) or '').strip(),
-                    transicion=(row.get(header_map['TRANSICION']) or '').strip(),
-                    situacion_penal=(row.get(header_map.get('SITUACION PENAL','')) or '').strip(),
-                    nueva_categoria=(row.get(header_map.get('NUEVA CATEGORIA','')) or '').strip(),
-                    acercar=(row.get(header_map.get('ACERCAR','')) or '').strip(),
-                    alejar=(row.get(header_map.get('ALEJAR','')) or '').strip(),
-                ))
-                count += 1
+            plays_to_create = build_plays_from_rows(match, reader, header_map)
+            count = len(plays_to_create)
 
             with transaction.atomic():
                 match.plays.all().delete()  # Reemplazar jugadas existentes
                 if plays_to_create:
-                    Play.objects.bulk_create(plays_to_create, batch_size=1000)
+                    Play.objects.bulk_load(plays_to_create)
                     # Extraer marcador final del último play para actualizar el resultado
                     last_marcador = next(
                         (p.marcador_final for p in reversed(plays_to_create) if p.marcador_final),
@@ -22,7 +22,6 @@ from django.utils import timezone
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.views.generic import TemplateView, View
-from openpyxl import load_workbook
 
 from .models import Match, CoachTournamentTeamParticipation, Team, Profile, GpsMetric
 from .services.stats_service import StatsService
@@ -68,11 +67,10 @@ class DashboardIndexView(DashboardAccessMixin, TemplateView):
 
         # Incluir alias de cada equipo para que la búsqueda funcione
         # independientemente de como quedó guardado el nombre en Match
-        alias_filter = Q()
         for t in teams_to_check:
-            alias_filter |= Q(name__iexact=t)
-        for obj in Team.objects.filter(alias_filter).exclude(alias__isnull=True).exclude(alias=''):
-            teams_upper.add(obj.alias.strip().upper())
+            obj = Team.objects.get_cached(t)
+            if obj and obj.alias:
+                teams_upper.add(obj.alias.strip().upper())
 
         next_match = (
             Match.objects
@@ -370,6 +368,7 @@ class MatchStatsView(DashboardAccessMixin, TemplateView):
             return rows
 
         if name.endswith('.xlsx') or name.endswith('.xlsm'):
+            from openpyxl import load_workbook  # sólo se carga al importar un Excel
             wb = load_workbook(uploaded_file, data_only=True)
             ws = wb.active
             rows_iter = list(ws.iter_rows(values_only=True))
@@ -505,7 +504,8 @@ class RivalCompareView(DashboardAccessMixin, TemplateView):
             today = timezone.localdate()
             teams_upper = set((effective_team or '').strip().upper() for _ in [1])
             if effective_team:
-                for obj in Team.objects.filter(name__iexact=effective_team).exclude(alias__isnull=True).exclude(alias=''):
+                obj = Team.objects.get_cached(effective_team)
+                if obj and obj.alias:
                     teams_upper.add(obj.alias.strip().upper())
             if teams_upper:
                 nq = Q()
@@ -5,6 +5,7 @@ from datetime import datetime, date
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.db import transaction
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
@@ -16,6 +17,10 @@ from .forms import FixtureMatchForm, FixtureExcelImportForm
 from .models import Match, Tournament
 
 
+# Columnas que el import de Excel del fixture completa en cada partido.
+FIXTURE_IMPORT_FIELDS = ('match_time', 'tournament', 'division', 'home_score', 'away_score', 'match_notes')
+
+
 class IsAdminMixin(UserPassesTestMixin):
     """Solo superusuarios o staff pueden administrar el fixture."""
     def test_func(self):
@@ -209,6 +214,7 @@ class FixtureExcelImportView(LoginRequiredMixin, IsAdminMixin, View):
             return redirect('player:fixture')
 
         created, updated_count, errors = 0, 0, []
+        filas = {}  # (local, visitante, fecha) -> valores del partido
         for row_num, row in enumerate(hoja.iter_rows(min_row=2, values_only=True), start=2):
             def get(idx):
                 if idx is None:
@@ -302,23 +308,47 @@ class FixtureExcelImportView(LoginRequiredMixin, IsAdminMixin, View):
             home_name = str(raw_local).strip().upper()
             away_name = str(raw_visit).strip().upper()
 
-            _, was_created = Match.objects.update_or_create(
-                home_team=home_name,
-                away_team=away_name,
-                match_date=fecha,
-                defaults={
-                    'match_time': hora,
-                    'tournament': torneo_obj,
-                    'division': division_val,
-                    'home_score': to_int(get(i_g_local)),
-                    'away_score': to_int(get(i_g_visit)),
-                    'match_notes': str(get(i_notas) or '').strip(),
-                }
-            )
-            if was_created:
-                created += 1
-            else:
+            # Si el partido se repite en el archivo gana la última fila (como con update_or_create)
+            key = (home_name, away_name, fecha)
+            if key in filas:
                 updated_count += 1
+            filas[key] = {
+                'match_time': hora,
+                'tournament': torneo_obj,
+                'division': division_val,
+                'home_score': to_int(get(i_g_local)),
+                'away_score': to_int(get(i_g_visit)),
+                'match_notes': str(get(i_notas) or '').strip(),
+            }
+
+        # Existentes en una sola consulta: se actualizan con bulk_update y el resto
+        # se inserta con bulk_create_normalized, sin un SELECT + INSERT/UPDATE por fila.
+        existentes = {}
+        if filas:
+            qs = Match.objects.filter(
+                match_date__in={fecha for _, _, fecha in filas},
+                home_team__in={home for home, _, _ in filas},
+            ).order_by('pk')
+            for match in qs:
+                existentes.setdefault((match.home_team, match.away_team, match.match_date), match)
+
+        a_actualizar, nuevos = [], []
+        for (home_name, away_name, fecha), valores in filas.items():
+            match = existentes.get((home_name, away_name, fecha))
+            if match is None:
+                nuevos.append(Match(home_team=home_name, away_team=away_name, match_date=fecha, **valores))
+                continue
+            for field, value in valores.items():
+                setattr(match, field, value)
+            a_actualizar.append(match)
+
+        with transaction.atomic():
+            if a_actualizar:
+                Match.objects.bulk_update(a_actualizar, list(FIXTURE_IMPORT_FIELDS))
+            if nuevos:
+                Match.objects.bulk_create_normalized(nuevos)
+        created += len(nuevos)
+        updated_count += len(a_actualizar)
 
         parts = []
         if created:
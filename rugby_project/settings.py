@@ -75,6 +75,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # ArrayField / índices GIN / lookups de trigramas
     'player',
     'rest_framework',
     'django_filters',
@@ -130,6 +131,10 @@ DATABASES = {
         # Para Cloud SQL Auth Proxy en local: HOST=127.0.0.1, PORT=5433
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        # Conexiones persistentes por hilo de gunicorn: evita abrir una conexión nueva
+        # (handshake + auth) en cada request; 0 vuelve al comportamiento anterior.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 